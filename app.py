@@ -7,17 +7,25 @@ Run:  streamlit run app.py
 """
 
 import streamlit as st
+import pandas as pd
 import os
 import sys
-import time
+import copy
+import functools
+import shutil
 import json
-from datetime import datetime, timedelta
+import html
+import heapq
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from dotenv import load_dotenv
+from zoneinfo import ZoneInfo
+from dotenv import dotenv_values
 
 # ─── Bootstrap ────────────────────────────────────────────────────────────────
-load_dotenv(Path(__file__).parent / ".env")
-
 PROJECT_ROOT = str(Path(__file__).parent)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
@@ -30,64 +38,103 @@ st.set_page_config(
     layout="wide",
 )
 
+# ─── Load .env ────────────────────────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def _init_env():
+    """Parse .env once per process; like load_dotenv, never overrides existing vars."""
+    env = dotenv_values(Path(__file__).parent / ".env")
+    os.environ.update({k: v for k, v in env.items() if v is not None and k not in os.environ})
+    return True
+
+_init_env()
+
+
 # ─── Bridge Streamlit Cloud Secrets → os.environ ─────────────────────────────
-try:
-    for key, value in st.secrets.items():
-        if isinstance(value, str) and key not in os.environ:
-            os.environ[key] = value
-except Exception:
-    pass
+@st.cache_resource
+def _bridge_secrets():
+    """Copy string secrets into os.environ (runs once per Streamlit server)."""
+    try:
+        new = {k: v for k, v in st.secrets.items()
+               if isinstance(v, str) and k not in os.environ}
+    except Exception:
+        return 0
+    os.environ.update(new)
+    return len(new)
+
+_bridge_secrets()
 
 # ─── Bootstrap Twitter Credential Files ──────────────────────────────────────
-import json as _json
-
-_TWITTER_CREDS_DIR = Path(__file__).parent / "modules" / "twitter" / "credentials"
-_TWITTER_CREDS_DIR.mkdir(parents=True, exist_ok=True)
-
-_TW_API_KEY = os.environ.get("TWITTER_CONSUMER_KEY", "")
-_TW_API_SECRET = os.environ.get("TWITTER_CONSUMER_SECRET", "")
-
-_TW_ACCOUNTS = {
-    "account_1": {
-        "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_1",
-        "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_1",
-    },
-    "account_2": {
-        "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_2",
-        "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_2",
-    },
-    "account_3": {
-        "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_3",
-        "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_3",
-    },
-}
+@st.cache_resource
+def _bootstrap_twitter_creds():
+    """Write missing credential files from env vars (runs once per Streamlit server)."""
+    # Built inside the cached body so reruns don't rebuild them at module level
+    creds_dir = Path(__file__).parent / "modules" / "twitter" / "credentials"
+    tw_accounts = {
+        "account_1": {
+            "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_1",
+            "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_1",
+        },
+        "account_2": {
+            "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_2",
+            "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_2",
+        },
+        "account_3": {
+            "token_env": "TWITTER_ACCESS_TOKEN_ACCOUNT_3",
+            "secret_env": "TWITTER_ACCESS_TOKEN_SECRET_ACCOUNT_3",
+        },
+    }
 
-for _acct_name, _acct_envs in _TW_ACCOUNTS.items():
-    _cred_file = _TWITTER_CREDS_DIR / f"{_acct_name}.json"
-    if not _cred_file.exists():
-        _token = os.environ.get(_acct_envs["token_env"], "")
-        _secret = os.environ.get(_acct_envs["secret_env"], "")
-        if _token and _secret and _TW_API_KEY:
-            _cred_data = {
-                "auth_type": "oauth1",
-                "api_key": _TW_API_KEY,
-                "api_secret": _TW_API_SECRET,
-                "access_token": _token,
-                "access_token_secret": _secret,
-            }
-            with open(_cred_file, "w") as _f:
-                _json.dump(_cred_data, _f, indent=2)
+    creds_dir.mkdir(parents=True, exist_ok=True)
+
+    api_key = os.environ.get("TWITTER_CONSUMER_KEY", "")
+    api_secret = os.environ.get("TWITTER_CONSUMER_SECRET", "")
+
+    for acct_name, acct_envs in tw_accounts.items():
+        token = os.environ.get(acct_envs["token_env"], "")
+        secret = os.environ.get(acct_envs["secret_env"], "")
+        if not (token and secret and api_key):
+            continue
+        cred_data = {
+            "auth_type": "oauth1",
+            "api_key": api_key,
+            "api_secret": api_secret,
+            "access_token": token,
+            "access_token_secret": secret,
+        }
+        # O_EXCL: create-or-skip in a single syscall, never overwrite
+        try:
+            fd = os.open(creds_dir / f"{acct_name}.json",
+                         os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            continue
+        with os.fdopen(fd, "w") as f:
+            json.dump(cred_data, f, indent=2)
+    return True
+
+_bootstrap_twitter_creds()
 
 # ─── Start Background Auto-Publisher ─────────────────────────────────────────
-# Runs a daemon thread that checks Supabase every 60s for due scheduled posts
+# Runs a daemon thread that checks Supabase every 60s (PUBLISHER_POLL_SEC) for due scheduled posts
 # and publishes them automatically (Instagram, Twitter text, Twitter video).
 
+def _publisher_poll_sec(default=60):
+    """PUBLISHER_POLL_SEC as a positive int; a bad value warns and falls back to the default."""
+    raw = os.environ.get("PUBLISHER_POLL_SEC", str(default))
+    try:
+        sec = int(raw)
+    except ValueError:
+        print(f"⚠️ PUBLISHER_POLL_SEC={raw!r} is not an integer — using {default}s")
+        return default
+    # 0 would make the publisher loop re-poll Supabase with no wait at all
+    return max(1, sec)
+
+
 @st.cache_resource
 def _init_auto_publisher():
     """Start the auto-publisher thread (runs once per Streamlit server)."""
     try:
         from modules.scheduler.auto_publisher import start_publisher
-        start_publisher()
+        start_publisher(interval=_publisher_poll_sec())
         return True
     except Exception as e:
         print(f"⚠️ Auto-publisher failed to start: {e}")
@@ -97,7 +144,7 @@ _auto_publisher_active = _init_auto_publisher()
 
 
 # ─── Custom CSS ───────────────────────────────────────────────────────────────
-st.markdown("""
+_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
 
@@ -268,7 +315,11 @@ st.markdown("""
         font-size: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted on every run: Streamlit drops any element a rerun doesn't re-emit,
+# so gating this behind a session flag would strip the styles after one click.
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 # ─── Session State Defaults ──────────────────────────────────────────────────
@@ -276,7 +327,8 @@ st.markdown("""
 defaults = {
     # Joke Generator tab
     "bridge_matches": [],
-    "selected_bridge_indices": [],
+    "selected_bridge_indices": set(),
+    "bridge_editor_base": set(),   # Select column fed to the editor; only search / (De)select All change it
     "bridge_selection_done": False,
     "jokes": [],
     "selected_indices": [],
@@ -296,33 +348,535 @@ defaults = {
     "news_jokes": {},           # {headline: [joke_dicts]}
     "news_pipeline_done": False,
     "news_pipeline_log": "",
+    # Tweet Reply Studio tab
+    "open_schedulers": set(),   # (t_idx, j_idx) trending / ("manual", m_idx) rows with the schedule form open
+    "schedule_errors": {},      # same keys → last failed Confirm message, shown under that form
 }
-for key, val in defaults.items():
-    if key not in st.session_state:
-        st.session_state[key] = val
+if "_defaults_initialized" not in st.session_state:
+    # One batched update; deepcopy so sessions never share the mutable [] / {} templates
+    st.session_state.update(copy.deepcopy(defaults), _defaults_initialized=True)
+
+
+# ─── Constants ────────────────────────────────────────────────────────────────
+
+IST = ZoneInfo("Asia/Kolkata")
+
+# Same path as modules.video_studio.studio.ASSETS_DIR, resolved without importing
+# moviepy/PIL/numpy just to list the asset folders
+VIDEO_ASSETS_DIR = os.path.join(PROJECT_ROOT, "modules", "video_studio", "assets")
+
+PLATFORM_ICONS = {
+    "instagram": "📸",
+    "twitter_text": "🐦",
+    "twitter_video": "🎬",
+}
+PLATFORM_LABELS = {
+    "instagram": "Instagram Reel",
+    "twitter_text": "Tweet (Text)",
+    "twitter_video": "Tweet (Video)",
+}
+# Bound once so per-row lookups skip the global + attribute resolution
+_platform_icon = PLATFORM_ICONS.get
+_platform_label = PLATFORM_LABELS.get
+
+# Schedule Manager card markup — parsed once, filled per row with str.format_map
+QUEUE_CARD_TPL = (
+    '<div class="queue-card">'
+    '<div class="q-platform">{icon} {label} {reply_html}</div>'
+    '<div class="q-caption">{caption}</div>'
+    '<div class="q-meta">📅 {sched} &nbsp;•&nbsp; ⏳ {countdown}</div>'
+    '</div>'
+)
+POSTED_CARD_TPL = (
+    '<div class="history-card posted">'
+    '<span class="h-icon">✅ {icon}</span> '
+    '<span class="h-caption">{caption}</span>'
+    '<br><span class="h-meta">📅 {posted_at}</span>'
+    '</div>'
+)
+FAILED_CARD_TPL = (
+    '<div class="history-card failed">'
+    '<span class="h-icon">❌ {icon}</span> '
+    '<span class="h-caption">{caption}</span>'
+    '<br><span class="h-error">⚠️ {error}</span>'
+    '</div>'
+)
+
+# Timeline styles; re-emitted each render since Streamlit drops elements a rerun skips
+SCHEDULE_CSS = """
+<style>
+    .next-up-card {
+        background: linear-gradient(135deg, rgba(139,92,246,0.15), rgba(59,130,246,0.1));
+        border: 2px solid rgba(139,92,246,0.4);
+        border-radius: 16px;
+        padding: 20px 24px;
+        margin: 12px 0;
+    }
+    .next-up-card .next-label {
+        color: #a78bfa;
+        font-size: 0.75rem;
+        font-weight: 700;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+    .next-up-card .next-caption {
+        color: #e2e8f0;
+        font-size: 1rem;
+        line-height: 1.5;
+        margin: 8px 0;
+        white-space: pre-wrap;
+        word-break: break-word;
+    }
+    .next-up-card .next-meta {
+        color: #94a3b8;
+        font-size: 0.85rem;
+        margin-top: 8px;
+    }
+    .countdown {
+        color: #a78bfa;
+        font-size: 1.1rem;
+        font-weight: 700;
+    }
+    .queue-card {
+        background: rgba(30,30,46,0.5);
+        border: 1px solid rgba(255,255,255,0.06);
+        border-radius: 10px;
+        padding: 12px 16px;
+        margin: 4px 0;
+    }
+    .queue-card .q-platform { color: #94a3b8; font-size: 0.75rem; text-transform: uppercase; }
+    .queue-card .q-caption { color: #e2e8f0; font-size: 0.9rem; margin: 4px 0; }
+    .queue-card .q-meta { color: #64748b; font-size: 0.78rem; }
+    .history-card {
+        background: rgba(255,255,255,0.02);
+        border: 1px solid rgba(255,255,255,0.05);
+        border-radius: 8px;
+        padding: 10px 14px;
+        margin: 3px 0;
+    }
+    .history-card.posted { border-left: 3px solid #10b981; }
+    .history-card.failed { border-left: 3px solid #ef4444; }
+    .history-card .h-icon { font-weight: 600; }
+    .history-card.posted .h-icon { color: #10b981; }
+    .history-card .h-caption { color: #e2e8f0; font-size: 0.9rem; }
+    .history-card .h-meta { color: #64748b; font-size: 0.75rem; }
+    .history-card.failed .h-icon { color: #ef4444; }
+    .history-card .h-error { color: #fca5a5; font-size: 0.75rem; font-family: monospace; }
+    .acct-stats {
+        display: flex; gap: 1rem; margin: 0.5rem 0 1rem 0;
+    }
+    .acct-stat {
+        padding: 0.5rem 1rem; border-radius: 8px;
+        background: rgba(255,255,255,0.03); border: 1px solid rgba(255,255,255,0.06);
+        text-align: center; font-size: 0.8rem; color: #94a3b8;
+    }
+    .acct-stat .num { font-size: 1.3rem; font-weight: 700; display: block; }
+    .acct-stat .num.pending { color: #facc15; }
+    .acct-stat .num.posted { color: #10b981; }
+    .acct-stat .num.failed { color: #ef4444; }
+    .reply-badge {
+        display: inline-block; background: rgba(29,161,242,0.15);
+        color: #1da1f2; padding: 2px 8px; border-radius: 10px;
+        font-size: 0.7rem; font-weight: 600; margin-left: 6px;
+    }
+</style>
+"""
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+def _ell(s, n):
+    """Truncate s to n chars with a single-codepoint ellipsis (one len() call)."""
+    return s if len(s) <= n else s[:n] + "…"
+
+
+def _html_ell(s, n):
+    """_ell, then HTML-escaped for card markup (truncating first keeps entities whole)."""
+    return html.escape(_ell(s, n))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
 def scan_assets(subfolder, extensions):
-    """Scan assets directory for files."""
-    from modules.video_studio.studio import ASSETS_DIR
-    target = os.path.join(ASSETS_DIR, subfolder)
-    if not os.path.exists(target):
+    """Scan assets directory for files (cached for 60s across reruns)."""
+    target = os.path.join(VIDEO_ASSETS_DIR, subfolder)
+    exts = tuple(e.lower() for e in extensions)
+    try:
+        with os.scandir(target) as it:
+            # sorted() drains the generator straight into its own list — no intermediate copy
+            return sorted(
+                e.name for e in it
+                if not e.name.startswith(".") and e.name.lower().endswith(exts)
+            )
+    except FileNotFoundError:
         return []
-    return sorted([
-        f for f in os.listdir(target)
-        if f.lower().endswith(extensions) and not f.startswith(".")
-    ])
 
 
-def get_joke_text(idx):
-    """Get the final (edited or original) joke text for an index."""
-    return st.session_state.edited_texts.get(
-        idx,
-        st.session_state.jokes[idx].get("joke", "")
+@functools.lru_cache(maxsize=512)
+def _parse_iso(iso_string):
+    """Parse a Supabase timestamp to an aware datetime (naive → UTC); memoised per string."""
+    try:
+        dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
+    except ValueError:
+        # Python 3.10's fromisoformat rejects Postgres fractions that aren't 3 or 6 digits
+        from dateutil.parser import parse as parse_dt
+        dt = parse_dt(iso_string)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+@st.cache_resource
+def _temp_dir():
+    """Upload scratch directory, created once per process."""
+    p = Path(__file__).parent / "temp"
+    p.mkdir(exist_ok=True)
+    return p
+
+
+UPLOAD_TTL_SEC = 6 * 3600  # saved uploads older than this are pruned from temp/
+
+
+def _prune_temp_uploads(max_age=UPLOAD_TTL_SEC):
+    """Delete temp/ uploads untouched for max_age seconds (abandoned sessions never clean up)."""
+    cutoff = time.time() - max_age
+    for entry in os.scandir(_temp_dir()):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _save_upload(uploaded, slot):
+    """Stream an UploadedFile into temp/ in 1 MiB chunks instead of materialising the whole video.
+
+    The file name carries the upload's file_id, so sessions uploading same-named files
+    never share a path, and reruns (which keep returning the same upload) skip the
+    write once it exists. Writes go to a .part file first so a half-written video is
+    never mistaken for a finished one.
+
+    slot names the uploader ("ig", "tw"); when it gets a new file, this session's
+    previous upload for that slot is deleted, and stale uploads from other sessions
+    are pruned. Returns the saved path.
+    """
+    dest = _temp_dir() / f"{uploaded.file_id}_{uploaded.name}"
+    if dest.exists():
+        return dest
+
+    saved = st.session_state.setdefault("_saved_uploads", {})
+    prev = saved.get(slot)
+    if prev and prev != str(dest):
+        try:
+            os.remove(prev)
+        except OSError:
+            pass
+    _prune_temp_uploads()
+
+    part = dest.with_name(dest.name + ".part")
+    uploaded.seek(0)
+    fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+        shutil.copyfileobj(uploaded, f, length=1 << 20)
+    os.replace(part, dest)
+    saved[slot] = str(dest)
+    return dest
+
+
+@st.cache_resource
+def _ig_env():
+    """Instagram token + business-account IDs, snapshotted from os.environ once per process."""
+    return {
+        "token": os.getenv("INSTAGRAM_ACCESS_TOKEN"),
+        "account_1_id": os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID_1", os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")),
+        "account_2_id": os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID_2"),
+    }
+
+
+@st.cache_resource
+def _ig_account_options():
+    """(options, keys, labels) for the Instagram account picker; shared read-only across sessions."""
+    ig_env = _ig_env()
+    options = {
+        "khushal_page": {
+            "label": "📸 Khushal Page",
+            "id": ig_env["account_1_id"],
+        },
+        "skin_nurture": {
+            "label": "🌿 Skin Nurture",
+            "id": ig_env["account_2_id"],
+        },
+    }
+    keys = tuple(options)
+    labels = tuple(options[k]["label"] for k in keys)
+    return options, keys, labels
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _path_exists(p: str) -> bool:
+    """os.path.exists for typed paths, memoised briefly so keystroke reruns skip the stat."""
+    return bool(p) and os.path.exists(p)
+
+
+# Submodules are resolved once per process and the module object is held by
+# st.cache_resource, so page handlers don't re-enter the import machinery on
+# every rerun.
+
+@st.cache_resource
+def _campaign_generator():
+    import modules.joke_generator.campaign_generator as m
+    return m
+
+
+@st.cache_resource
+def _twitter_client_mod():
+    import modules.twitter.twitter_client as m
+    return m
+
+
+@st.cache_resource
+def _video_studio():
+    import modules.video_studio.studio as m
+    return m
+
+
+@st.cache_resource
+def _caption_generator():
+    import modules.caption_generator as m
+    return m
+
+
+@st.cache_resource
+def _scheduler_db():
+    import modules.scheduler.scheduler_db as m
+    return m
+
+
+@st.cache_resource
+def _trends_fetcher():
+    import modules.news_workflow.twitter_trends_fetcher as m
+    return m
+
+
+@st.cache_resource
+def _slot_calculator():
+    import modules.scheduler.slot_calculator as m
+    return m
+
+
+@st.cache_resource
+def _auto_publisher():
+    import modules.scheduler.auto_publisher as m
+    return m
+
+
+@st.cache_resource
+def _ig_uploader():
+    import modules.video_studio.uploader as m
+    return m
+
+
+@st.cache_resource
+def _news_fetcher():
+    import modules.news_workflow.news_fetcher as m
+    return m
+
+
+@st.cache_resource
+def _notifier():
+    import modules.news_workflow.notifier as m
+    return m
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def search_bridges_cached(headline: str, top_k: int = 30):
+    """search_bridges() memoised per (headline, top_k) — repeat topics skip the embedding + RPC."""
+    return _campaign_generator().search_bridges(headline, top_k=top_k)
+
+
+class _PartialBridgeSearch(Exception):
+    """Raised out of the cached search so a batch with failed headlines is never memoised."""
+
+    def __init__(self, matches, errors):
+        super().__init__(f"{len(errors)} bridge searches failed")
+        self.matches, self.errors = matches, errors
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _search_bridges_many_ok(headlines: tuple, top_k: int):
+    matches, errors = _campaign_generator().search_bridges_many(list(headlines), top_k=top_k)
+    if errors:
+        raise _PartialBridgeSearch(matches, errors)
+    return matches
+
+
+def search_bridges_many_cached(headlines: tuple, top_k: int = 30):
+    """
+    search_bridges_many() memoised per headline batch — one embedding request for all of them.
+    Returns ({headline: matches}, {headline: error}); only fully successful batches are cached,
+    so a re-run retries headlines whose search failed.
+    """
+    try:
+        return _search_bridges_many_ok(headlines, top_k), {}
+    except _PartialBridgeSearch as e:
+        return e.matches, e.errors
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_twitter_accounts():
+    """Credential-file account names, re-scanned at most every 30s."""
+    return _twitter_client_mod().list_accounts()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_twitter_sample_videos():
+    """Sample video filenames, re-scanned at most every 60s."""
+    return _twitter_client_mod().list_sample_videos()
+
+
+@st.cache_resource(ttl=3600)
+def get_twitter_client(account: str):
+    """Build (once per hour, per account) the TwitterClient for an account."""
+    return _twitter_client_mod().TwitterClient(account)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def get_twitter_user_info(account: str):
+    """Fetch /users/me for an account, shared across sessions for one 15-min rate-limit window.
+
+    Failures (incl. 429) raise and are not cached.
+    """
+    return get_twitter_client(account).get_me()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_scheduled():
+    """Scheduled posts grouped by status (one query), cached for 30s; call fetch_scheduled.clear() after any write."""
+    sdb = _scheduler_db()
+    return sdb.get_all_scheduled_grouped(columns=sdb.SCHEDULE_LIST_COLUMNS)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_trending_results(results_mtime):
+    """load_latest_results() (Supabase latest.json → newest local file), cached 5 min; keyed on the local results dir mtime."""
+    return _trends_fetcher().load_latest_results()
+
+
+def load_trending_results():
+    """Latest pre-generated reply jokes; a new local results file busts the cache immediately."""
+    try:
+        mtime = os.stat(_trends_fetcher().RESULTS_DIR).st_mtime
+    except OSError:
+        mtime = 0.0
+    return _load_trending_results(mtime)
+
+
+def _set_bridge_selection(indices):
+    """Select/Deselect All callback — runs before the fragment redraws the editor."""
+    st.session_state.selected_bridge_indices = set(indices)
+    st.session_state.bridge_editor_base = set(indices)
+    # Drop the editor's pending edits so it re-reads the new Select column
+    st.session_state.pop("bridge_editor", None)
+
+
+def _confirm_reply_schedule(form_key, text_key, reply_to, date_key, time_key, account_key):
+    """
+    Schedule Reply confirm callback — queues the reply and closes its form before the rerun.
+    Widget values are read by key here, so an edit made just before the click is what gets queued;
+    a failure is kept in schedule_errors for the form to show in place.
+    """
+    ss = st.session_state
+    try:
+        sched_dt = datetime.combine(ss[date_key], ss[time_key], tzinfo=IST)
+        _scheduler_db().insert_schedule(
+            platform="twitter_text",
+            video_url=None,
+            caption=ss[text_key],
+            scheduled_time=sched_dt,
+            twitter_account=ss.get(account_key, "account_1"),
+            reply_to_tweet_id=reply_to,
+        )
+    except Exception as e:
+        ss.schedule_errors[form_key] = str(e)
+        return
+    fetch_scheduled.clear()
+    st.toast(f"✅ Scheduled for {sched_dt.strftime('%b %d, %I:%M %p IST')}")
+    ss.open_schedulers.discard(form_key)
+
+
+@st.fragment
+def _bridge_selector(bm, topic):
+    """Bridge selection UI; widget interactions here rerun only this fragment."""
+    ss = st.session_state
+    st.markdown(
+        f"**{len(bm)} bridge structures found** — "
+        f"select the ones you want to generate jokes from:"
+    )
+
+    col_sel_all, col_desel_all, _ = st.columns([1, 1, 4])
+    with col_sel_all:
+        st.button("✅ Select All", use_container_width=True,
+                  on_click=_set_bridge_selection, args=(range(len(bm)),))
+    with col_desel_all:
+        st.button("❎ Deselect All", use_container_width=True,
+                  on_click=_set_bridge_selection, args=((),))
+
+    # One data_editor instead of a checkbox + card per match. Its input is built from
+    # the stable base selection, never from the live one: the widget id hashes its data,
+    # so feeding edits back in would reset the editor and drop every other toggle.
+    base = ss.bridge_editor_base
+    # Column-wise construction: one pass per column, no per-row dicts for pandas to re-key
+    bridge_df = pd.DataFrame({
+        "Select": [i in base for i in range(len(bm))],
+        "#": range(1, len(bm) + 1),
+        "Bridge": [_ell(m.get("bridge_content", ""), 80) for m in bm],
+        "Sim": [m.get("similarity", 0) for m in bm],
+        "Text": [_ell(m.get("searchable_text", "N/A"), 200) for m in bm],
+    })
+    edited = st.data_editor(
+        bridge_df,
+        column_config={
+            "Select": st.column_config.CheckboxColumn(),
+            "Sim": st.column_config.NumberColumn(format="%.3f"),
+        },
+        disabled=["#", "Bridge", "Sim", "Text"],
+        hide_index=True,
+        use_container_width=True,
+        key="bridge_editor",
+    )
+    sel = set(edited.index[edited["Select"]].tolist())
+    ss.selected_bridge_indices = sel
+
+    num_selected = len(sel)
+
+    generate_btn = st.button(
+        f"🔥 Generate {num_selected} Joke{'s' if num_selected != 1 else ''}"
+        if num_selected > 0 else "🔥 Select bridges above first",
+        type="primary",
+        use_container_width=True,
+        disabled=num_selected == 0,
+        # Stable key: the label changes with the count, which would otherwise
+        # give the button a new widget identity on every selection change
+        key="bridge_generate_btn",
     )
 
+    if generate_btn and num_selected > 0:
+        selected_matches = [bm[i] for i in sorted(sel)]
+        with st.spinner(f"🔥 Generating {num_selected} jokes via Gemini..."):
+            try:
+                generate_from_selected = _campaign_generator().generate_from_selected
+                results = generate_from_selected(topic, selected_matches)
+                ss.jokes = results
+                ss.generation_done = True
+                ss.bridge_selection_done = True
+                ss.selected_indices = []
+                ss.edited_texts = {}
+                ss.distribution_choices = {}
+                ss.video_paths = {}
+                ss.upload_results = {}
+                ss.tweet_results = {}
+                ss.videos_done = False
+                st.rerun()  # full app rerun so the jokes section renders
+            except Exception as e:
+                st.error(f"❌ Generation failed: {e}")
+
 
 # ─── Header ──────────────────────────────────────────────────────────────────
 
@@ -333,7 +887,8 @@ st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
 # ─── Sidebar Navigation ─────────────────────────────────────────────────────
 
-PAGES = [
+# Tuple of literals: compiled to a single constant, not rebuilt on each rerun
+PAGES = (
     "🧠 Joke Generator",
     "✨ Caption Generator",
     "🎬 Video Studio",
@@ -342,7 +897,7 @@ PAGES = [
     "📅 Schedule Manager",
     "📰 Daily News Jokes",
     "🐦 Tweet Reply Studio",
-]
+)
 
 with st.sidebar:
     st.markdown("### 🎭 Navigation")
@@ -358,6 +913,9 @@ with st.sidebar:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 if page == "🧠 Joke Generator":
+    # Bind the session-state proxy once; attribute loads through it aren't free
+    ss = st.session_state
+
     st.markdown("""
     <div class="section-header">
         <span class="icon">🧠</span>
@@ -385,141 +943,64 @@ if page == "🧠 Joke Generator":
         reset_btn = st.button("🔄 New Search", use_container_width=True)
 
     if reset_btn:
-        for key in ["bridge_matches", "selected_bridge_indices", "bridge_selection_done",
+        for key in ["bridge_matches", "selected_bridge_indices", "bridge_editor_base", "bridge_selection_done",
                      "jokes", "selected_indices", "edited_texts", "distribution_choices",
                      "video_paths", "upload_results", "tweet_results", "generation_done",
                      "videos_done"]:
-            st.session_state[key] = defaults[key]
-        st.rerun()
+            ss[key] = copy.deepcopy(defaults[key])
+        ss.pop("bridge_editor", None)
 
     # Phase 1: Bridge Search
     if search_btn and topic.strip():
         with st.spinner("🔍 Expanding themes and searching bridge embeddings..."):
             try:
-                from modules.joke_generator.campaign_generator import search_bridges
-                matches = search_bridges(topic.strip(), top_k=30)
-                st.session_state.bridge_matches = matches
-                st.session_state.selected_bridge_indices = []
-                st.session_state.bridge_selection_done = False
-                st.session_state.jokes = []
-                st.session_state.selected_indices = []
-                st.session_state.edited_texts = {}
-                st.session_state.distribution_choices = {}
-                st.session_state.video_paths = {}
-                st.session_state.upload_results = {}
-                st.session_state.tweet_results = {}
-                st.session_state.generation_done = False
-                st.session_state.videos_done = False
-                st.rerun()
+                matches = search_bridges_cached(topic.strip(), top_k=30)
+                ss.bridge_matches = matches
+                ss.selected_bridge_indices = set()
+                ss.bridge_editor_base = set()
+                ss.pop("bridge_editor", None)
+                ss.bridge_selection_done = False
+                ss.jokes = []
+                ss.selected_indices = []
+                ss.edited_texts = {}
+                ss.distribution_choices = {}
+                ss.video_paths = {}
+                ss.upload_results = {}
+                ss.tweet_results = {}
+                ss.generation_done = False
+                ss.videos_done = False
             except Exception as e:
                 st.error(f"❌ Bridge search failed: {e}")
 
     # Phase 1 Results
-    if st.session_state.bridge_matches and not st.session_state.generation_done:
-        st.markdown(
-            f"**{len(st.session_state.bridge_matches)} bridge structures found** — "
-            f"select the ones you want to generate jokes from:"
-        )
-
-        col_sel_all, col_desel_all, _ = st.columns([1, 1, 4])
-        with col_sel_all:
-            if st.button("✅ Select All", use_container_width=True):
-                st.session_state.selected_bridge_indices = list(
-                    range(len(st.session_state.bridge_matches))
-                )
-                st.rerun()
-        with col_desel_all:
-            if st.button("❎ Deselect All", use_container_width=True):
-                st.session_state.selected_bridge_indices = []
-                st.rerun()
-
-        for i, match in enumerate(st.session_state.bridge_matches):
-            col_check, col_bridge = st.columns([0.05, 0.95])
-
-            with col_check:
-                selected = st.checkbox(
-                    "sel",
-                    key=f"bridge_sel_{i}",
-                    value=i in st.session_state.selected_bridge_indices,
-                    label_visibility="collapsed",
-                )
-                if selected and i not in st.session_state.selected_bridge_indices:
-                    st.session_state.selected_bridge_indices.append(i)
-                elif not selected and i in st.session_state.selected_bridge_indices:
-                    st.session_state.selected_bridge_indices.remove(i)
-
-            with col_bridge:
-                joke_text = match.get("searchable_text", "N/A")
-                bridge = match.get("bridge_content", "")
-                similarity = match.get("similarity", 0)
-                display_text = joke_text[:200] + "..." if len(joke_text) > 200 else joke_text
-
-                st.markdown(f"""
-                <div class="joke-card">
-                    <div class="joke-text">{display_text}</div>
-                    <div class="joke-meta">
-                        <span class="badge">#{i + 1}</span>
-                        <span>Similarity: {similarity:.3f}</span>
-                        <span>🌉 {bridge[:80]}{'...' if len(bridge) > 80 else ''}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        num_selected = len(st.session_state.selected_bridge_indices)
-
-        generate_btn = st.button(
-            f"🔥 Generate {num_selected} Joke{'s' if num_selected != 1 else ''}"
-            if num_selected > 0 else "🔥 Select bridges above first",
-            type="primary",
-            use_container_width=True,
-            disabled=num_selected == 0,
-        )
-
-        if generate_btn and num_selected > 0:
-            selected_matches = [
-                st.session_state.bridge_matches[i]
-                for i in sorted(st.session_state.selected_bridge_indices)
-            ]
-            with st.spinner(f"🔥 Generating {num_selected} jokes via Gemini..."):
-                try:
-                    from modules.joke_generator.campaign_generator import generate_from_selected
-                    results = generate_from_selected(topic.strip(), selected_matches)
-                    st.session_state.jokes = results
-                    st.session_state.generation_done = True
-                    st.session_state.bridge_selection_done = True
-                    st.session_state.selected_indices = []
-                    st.session_state.edited_texts = {}
-                    st.session_state.distribution_choices = {}
-                    st.session_state.video_paths = {}
-                    st.session_state.upload_results = {}
-                    st.session_state.tweet_results = {}
-                    st.session_state.videos_done = False
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Generation failed: {e}")
+    bm = ss.bridge_matches
+    if bm and not ss.generation_done:
+        _bridge_selector(bm, topic.strip())
 
     # Generated Jokes Display
-    if st.session_state.jokes:
-        st.markdown(f"**{len(st.session_state.jokes)} jokes generated:**")
-
-        for i, joke_data in enumerate(st.session_state.jokes):
-            engine = joke_data.get("engine", "?")
-            similarity = joke_data.get("similarity", 0)
-
-            st.markdown(f"""
-            <div class="joke-card">
-                <div class="joke-text">{joke_data.get('joke', 'N/A')}</div>
-                <div class="joke-meta">
-                    <span class="badge">{engine}</span>
-                    <span>Similarity: {similarity:.2f}</span>
-                    <span>Strategy: {joke_data.get('selected_strategy', 'N/A')[:60]}</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Copy button
-            if st.button(f"📋 Copy Joke #{i+1}", key=f"copy_joke_{i}"):
-                st.code(joke_data.get("joke", ""), language=None)
+    jokes = ss.jokes
+    if jokes:
+        st.markdown(f"**{len(jokes)} jokes generated:**")
+
+        st.markdown("".join(
+            f'<div class="joke-card">'
+            f'<div class="joke-text">{joke_data.get("joke", "N/A")}</div>'
+            f'<div class="joke-meta">'
+            f'<span class="badge">{joke_data.get("engine", "?")}</span>'
+            f'<span>Similarity: {joke_data.get("similarity", 0):.2f}</span>'
+            f'<span>Strategy: {joke_data.get("selected_strategy", "N/A")[:60]}</span>'
+            f'</div></div>'
+            for joke_data in jokes
+        ), unsafe_allow_html=True)
+
+        # One copy widget for the whole list instead of a button per joke
+        copy_idx = st.selectbox(
+            "📋 Copy a joke",
+            options=range(len(jokes)),
+            format_func=lambda i: f"Joke #{i+1}",
+            key="copy_joke_idx",
+        )
+        st.code(jokes[copy_idx].get("joke", ""), language=None)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -564,10 +1045,10 @@ elif page == "✨ Caption Generator":
     if gen_caption_btn and caption_input.strip():
         with st.spinner("✨ Generating viral caption..."):
             try:
-                from modules.caption_generator import generate_caption, format_caption
+                cg = _caption_generator()
                 plat = platform.lower()
-                raw = generate_caption(caption_input.strip(), topic=caption_topic if caption_topic else "", platform=plat)
-                formatted = format_caption(raw, platform=plat)
+                raw = cg.generate_caption(caption_input.strip(), topic=caption_topic if caption_topic else "", platform=plat)
+                formatted = cg.format_caption(raw, platform=plat)
 
                 st.markdown("### 📝 Generated Caption")
                 st.text_area("Caption (edit as needed)", value=formatted, height=200, key="generated_caption_output")
@@ -600,8 +1081,10 @@ elif page == "🎬 Video Studio":
         key="video_studio_text",
     )
 
+    if st.button("🔄 Rescan assets", key="vs_rescan_assets"):
+        scan_assets.clear()
+
     templates = scan_assets("templates", (".mp4", ".mov"))
-    templates = [t for t in templates if not t.endswith(".json")]
     music_files = scan_assets("music", (".mp3", ".wav", ".m4a"))
 
     col_template, col_music, col_duration = st.columns([2, 2, 1])
@@ -623,7 +1106,7 @@ elif page == "🎬 Video Studio":
     with col_duration:
         duration = st.number_input("⏱ Duration (s)", min_value=5, max_value=60, value=15, step=5)
 
-    can_produce = bool(video_joke_text.strip() and templates and music_files)
+    can_produce = bool(video_joke_text and not video_joke_text.isspace() and templates and music_files)
 
     produce_btn = st.button(
         "🎬 Generate Video",
@@ -633,7 +1116,8 @@ elif page == "🎬 Video Studio":
     )
 
     if produce_btn and can_produce:
-        from modules.video_studio.studio import generate_reel, ASSETS_DIR
+        studio = _video_studio()
+        generate_reel, ASSETS_DIR = studio.generate_reel, studio.ASSETS_DIR
 
         with st.spinner("🎬 Rendering video..."):
             try:
@@ -656,7 +1140,7 @@ elif page == "🎬 Video Studio":
     # Show generated video
     if st.session_state.get("standalone_video_path"):
         vpath = st.session_state["standalone_video_path"]
-        if os.path.exists(vpath):
+        if _path_exists(vpath):
             st.markdown("### 🎞️ Generated Reel")
             st.video(vpath)
             st.caption(f"File: `{vpath}`")
@@ -675,21 +1159,8 @@ elif page == "📸 Post to Instagram":
     </div>
     """, unsafe_allow_html=True)
 
-    ig_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
-
-    IG_ACCOUNT_OPTIONS = {
-        "khushal_page": {
-            "label": "📸 Khushal Page",
-            "id": os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID_1", os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")),
-        },
-        "skin_nurture": {
-            "label": "🌿 Skin Nurture",
-            "id": os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID_2"),
-        },
-    }
-
-    ig_account_keys = list(IG_ACCOUNT_OPTIONS.keys())
-    ig_account_labels = [IG_ACCOUNT_OPTIONS[k]["label"] for k in ig_account_keys]
+    ig_token = _ig_env()["token"]
+    IG_ACCOUNT_OPTIONS, ig_account_keys, ig_account_labels = _ig_account_options()
 
     selected_ig_idx = st.selectbox(
         "📸 Instagram Account",
@@ -721,7 +1192,7 @@ elif page == "📸 Post to Instagram":
             value=st.session_state.get("standalone_video_path", ""),
             placeholder="/path/to/your/video.mp4",
         )
-        if ig_video_path_input and os.path.exists(ig_video_path_input):
+        if _path_exists(ig_video_path_input):
             ig_video_path = ig_video_path_input
             st.video(ig_video_path)
         elif ig_video_path_input:
@@ -729,12 +1200,7 @@ elif page == "📸 Post to Instagram":
     else:
         ig_uploaded = st.file_uploader("Upload .mp4 video", type=["mp4", "mov"], key="ig_upload")
         if ig_uploaded:
-            temp_dir = Path(__file__).parent / "temp"
-            temp_dir.mkdir(exist_ok=True)
-            temp_path = temp_dir / ig_uploaded.name
-            with open(temp_path, "wb") as f:
-                f.write(ig_uploaded.getbuffer())
-            ig_video_path = str(temp_path)
+            ig_video_path = str(_save_upload(ig_uploaded, "ig"))
             st.video(ig_video_path)
 
     ig_caption = st.text_area(
@@ -751,9 +1217,9 @@ elif page == "📸 Post to Instagram":
             if ig_caption.strip():
                 with st.spinner("✨ Generating..."):
                     try:
-                        from modules.caption_generator import generate_caption, format_caption
-                        raw = generate_caption(ig_caption.strip(), platform="instagram")
-                        formatted = format_caption(raw, platform="instagram")
+                        cg = _caption_generator()
+                        raw = cg.generate_caption(ig_caption.strip(), platform="instagram")
+                        formatted = cg.format_caption(raw, platform="instagram")
                         st.session_state["ig_standalone_caption"] = formatted
                         st.rerun()
                     except Exception as e:
@@ -776,25 +1242,21 @@ elif page == "📸 Post to Instagram":
                 try:
                     # Upload to Supabase Storage first to get a public URL
                     # (required because rupload binary upload is broken for this app)
-                    from supabase import create_client
                     sb_url = os.environ.get("SUPABASE_URL", "")
-                    sb_key = os.environ.get("SUPABASE_KEY", "")
-                    sb = create_client(sb_url, sb_key)
+                    sb = _scheduler_db().get_client()  # the scheduler's memoised client + pool
                     temp_name = f"ig_post_now_{os.path.basename(ig_video_path)}"
-                    with open(ig_video_path, "rb") as vf:
-                        video_bytes = vf.read()
                     try:
                         sb.storage.from_("ready_to_publish").remove([temp_name])
                     except Exception:
                         pass
-                    sb.storage.from_("ready_to_publish").upload(
-                        path=temp_name, file=video_bytes,
-                        file_options={"content-type": "video/mp4"},
-                    )
+                    with open(ig_video_path, "rb") as vf:
+                        sb.storage.from_("ready_to_publish").upload(
+                            path=temp_name, file=vf,
+                            file_options={"content-type": "video/mp4"},
+                        )
                     public_video_url = f"{sb_url}/storage/v1/object/public/ready_to_publish/{temp_name}"
 
-                    from modules.video_studio.uploader import upload_reel
-                    result = upload_reel(
+                    result = _ig_uploader().upload_reel(
                         access_token=ig_token,
                         ig_user_id=ig_account_id,
                         file_path=ig_video_path,
@@ -825,13 +1287,18 @@ elif page == "📸 Post to Instagram":
         if ig_sched_btn:
             with st.spinner("📅 Scheduling..."):
                 try:
-                    from modules.scheduler.scheduler_db import (
-                        upload_to_storage, insert_schedule, get_last_scheduled_time
+                    sdb, slots = _scheduler_db(), _slot_calculator()
+                    upload_to_storage, insert_schedule, get_last_scheduled_time = (
+                        sdb.upload_to_storage, sdb.insert_schedule, sdb.get_last_scheduled_time
                     )
-                    from modules.scheduler.slot_calculator import get_next_slot, format_slot_display
-
-                    public_url = upload_to_storage(ig_video_path)
-                    last_time = get_last_scheduled_time(platform="instagram", twitter_account=None)
+                    get_next_slot, format_slot_display = slots.get_next_slot, slots.format_slot_display
+
+                    # The slot lookup doesn't depend on the upload — overlap the two
+                    with ThreadPoolExecutor(max_workers=2) as ex:
+                        fut_up = ex.submit(upload_to_storage, ig_video_path)
+                        fut_slot = ex.submit(get_last_scheduled_time, platform="instagram", twitter_account=None)
+                        public_url = fut_up.result()
+                        last_time = fut_slot.result()
                     next_slot = get_next_slot(last_time)
                     display_time = format_slot_display(next_slot)
 
@@ -842,6 +1309,7 @@ elif page == "📸 Post to Instagram":
                         scheduled_time=next_slot,
                         instagram_account=selected_ig_account,
                     )
+                    fetch_scheduled.clear()
                     st.success(f"📅 Scheduled for {display_time}")
                 except Exception as e:
                     st.error(f"❌ Scheduling failed: {e}")
@@ -860,12 +1328,20 @@ elif page == "🐦 Post to Twitter":
     </div>
     """, unsafe_allow_html=True)
 
-    from modules.twitter.twitter_client import (
-        TwitterClient, TwitterClientError, list_accounts, list_sample_videos,
-        VIDEOS_DIR
-    )
+    tw = _twitter_client_mod()
+    TwitterClientError = tw.TwitterClientError
+    VIDEOS_DIR = tw.VIDEOS_DIR
 
-    accounts = list_accounts()
+    with st.sidebar:
+        if st.button("🔄 Refresh accounts", use_container_width=True):
+            list_twitter_accounts.clear()
+            list_twitter_sample_videos.clear()
+            # Credential files may have changed — drop clients and cached /users/me too
+            get_twitter_client.clear()
+            get_twitter_user_info.clear()
+            st.session_state.twitter_user_info = None
+
+    accounts = list_twitter_accounts()
 
     if not accounts:
         st.markdown(
@@ -890,8 +1366,7 @@ elif page == "🐦 Post to Twitter":
 
             if st.session_state.twitter_user_info is None and selected_account:
                 try:
-                    client = TwitterClient(selected_account)
-                    user_info = client.get_me()
+                    user_info = get_twitter_user_info(selected_account)
                     st.session_state.twitter_user_info = user_info
                 except Exception as e:
                     st.session_state.twitter_user_info = {"error": str(e)}
@@ -922,7 +1397,9 @@ elif page == "🐦 Post to Twitter":
         )
 
         char_count = len(tweet_text)
-        over_class = "over" if char_count > 280 else ""
+        too_long = char_count > 280
+        has_text = bool(tweet_text) and not tweet_text.isspace()
+        over_class = "over" if too_long else ""
         st.markdown(
             f'<div class="char-count {over_class}">{char_count}/280 chars</div>',
             unsafe_allow_html=True,
@@ -930,12 +1407,12 @@ elif page == "🐦 Post to Twitter":
 
         # AI Caption
         if st.button("✨ Generate Caption", key="tw_ai_caption_btn"):
-            if tweet_text.strip():
+            if has_text:
                 with st.spinner("✨ Generating..."):
                     try:
-                        from modules.caption_generator import generate_caption, format_caption
-                        raw = generate_caption(tweet_text.strip(), platform="twitter")
-                        formatted = format_caption(raw, platform="twitter")
+                        cg = _caption_generator()
+                        raw = cg.generate_caption(tweet_text.strip(), platform="twitter")
+                        formatted = cg.format_caption(raw, platform="twitter")
                         st.session_state["tw_standalone_text"] = formatted
                         st.rerun()
                     except Exception as e:
@@ -954,12 +1431,11 @@ elif page == "🐦 Post to Twitter":
             )
 
             if tw_video_source == "📂 Sample videos":
-                sample_videos = list_sample_videos()
+                sample_videos = list_twitter_sample_videos()
                 if sample_videos:
                     selected_sample = st.selectbox("Select sample", sample_videos, key="tw_sample_sel")
+                    # Name comes from the cached listing, so the file is known to exist
                     tw_video_path = os.path.join(str(VIDEOS_DIR), selected_sample)
-                    if os.path.exists(tw_video_path):
-                        st.video(tw_video_path)
                 else:
                     st.warning("No sample videos found.")
             elif tw_video_source == "📁 Custom path":
@@ -968,22 +1444,18 @@ elif page == "🐦 Post to Twitter":
                     value=st.session_state.get("standalone_video_path", ""),
                     key="tw_custom_video_path",
                 )
-                if tw_custom_path and os.path.exists(tw_custom_path):
+                if _path_exists(tw_custom_path):
                     tw_video_path = tw_custom_path
-                    st.video(tw_video_path)
             else:
                 tw_uploaded = st.file_uploader("Upload .mp4", type=["mp4"], key="tw_upload")
                 if tw_uploaded:
-                    temp_dir = Path(__file__).parent / "temp"
-                    temp_dir.mkdir(exist_ok=True)
-                    temp_path = temp_dir / tw_uploaded.name
-                    with open(temp_path, "wb") as f:
-                        f.write(tw_uploaded.getbuffer())
-                    tw_video_path = str(temp_path)
-                    st.video(tw_video_path)
+                    tw_video_path = str(_save_upload(tw_uploaded, "tw"))
 
-        too_long = char_count > 280
-        can_tweet = bool(accounts and not too_long and tweet_text.strip())
+            # st.video reads the whole file into the media store each run, so only on request
+            if tw_video_path and st.toggle("▶️ Preview video", key="tw_video_preview"):
+                st.video(tw_video_path)
+
+        can_tweet = bool(accounts) and not too_long and has_text
         if attach_video and not tw_video_path:
             can_tweet = False
 
@@ -1000,7 +1472,7 @@ elif page == "🐦 Post to Twitter":
             if post_tweet_btn:
                 with st.spinner("🐦 Posting tweet..."):
                     try:
-                        client = TwitterClient(selected_account)
+                        client = get_twitter_client(selected_account)
                         if attach_video and tw_video_path:
                             result = client.post_tweet_with_video(tweet_text, tw_video_path)
                         else:
@@ -1025,20 +1497,23 @@ elif page == "🐦 Post to Twitter":
             if sched_tw_btn:
                 with st.spinner("📅 Scheduling tweet..."):
                     try:
-                        from modules.scheduler.scheduler_db import (
-                            upload_to_storage, insert_schedule, get_last_scheduled_time
+                        sdb, slots = _scheduler_db(), _slot_calculator()
+                        upload_to_storage, insert_schedule, get_last_scheduled_time = (
+                            sdb.upload_to_storage, sdb.insert_schedule, sdb.get_last_scheduled_time
                         )
-                        from modules.scheduler.slot_calculator import get_next_slot, format_slot_display
+                        get_next_slot, format_slot_display = slots.get_next_slot, slots.format_slot_display
 
                         platform = "twitter_video" if attach_video and tw_video_path else "twitter_text"
                         video_url = None
 
-                        if platform == "twitter_video":
-                            video_url = upload_to_storage(tw_video_path)
-
-                        last_time = get_last_scheduled_time(
-                            platform=platform, twitter_account=selected_account
-                        )
+                        # The slot lookup doesn't depend on the upload — overlap the two
+                        with ThreadPoolExecutor(max_workers=2) as ex:
+                            fut_slot = ex.submit(
+                                get_last_scheduled_time, platform=platform, twitter_account=selected_account
+                            )
+                            if platform == "twitter_video":
+                                video_url = ex.submit(upload_to_storage, tw_video_path).result()
+                            last_time = fut_slot.result()
                         next_slot = get_next_slot(last_time)
                         display_time = format_slot_display(next_slot)
 
@@ -1049,6 +1524,7 @@ elif page == "🐦 Post to Twitter":
                             scheduled_time=next_slot,
                             twitter_account=selected_account,
                         )
+                        fetch_scheduled.clear()
                         st.success(f"📅 Scheduled for {display_time}")
                     except Exception as e:
                         st.error(f"❌ Scheduling failed: {e}")
@@ -1082,105 +1558,34 @@ elif page == "📅 Schedule Manager":
         )
 
     try:
-        from modules.scheduler.scheduler_db import (
-            get_all_scheduled, delete_schedule, update_schedule_time,
-            format_time_ist, retry_failed, retry_all_failed,
-        )
-        import pytz
-        from dateutil.parser import parse as _parse_dt
-        IST = pytz.timezone("Asia/Kolkata")
-
-        PLATFORM_ICONS = {
-            "instagram": "📸",
-            "twitter_text": "🐦",
-            "twitter_video": "🎬",
-        }
-        PLATFORM_LABELS = {
-            "instagram": "Instagram Reel",
-            "twitter_text": "Tweet (Text)",
-            "twitter_video": "Tweet (Video)",
-        }
+        sdb = _scheduler_db()
+        format_time_ist = sdb.format_time_ist
+
+        def _invalidating(fn):
+            """Wrap a scheduler_db write so the cached fetch_scheduled() is dropped afterwards."""
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    fetch_scheduled.clear()
+            return wrapper
+
+        delete_schedule = _invalidating(sdb.delete_schedule)
+        update_schedule_time = _invalidating(sdb.update_schedule_time)
+        retry_failed = _invalidating(sdb.retry_failed)
+        retry_all_failed = _invalidating(sdb.retry_all_failed)
 
         # ── Fetch all data once ──────────────────────────────────────────
-        all_posts = get_all_scheduled()
-
-        all_pending = [p for p in all_posts if p.get("status") == "pending"]
-        all_posted = [p for p in all_posts if p.get("status") == "posted"]
-        all_failed = [p for p in all_posts if p.get("status") == "failed"]
-
-        # ── Extra CSS for new UI ─────────────────────────────────────────
-        st.markdown("""
-        <style>
-            .next-up-card {
-                background: linear-gradient(135deg, rgba(139,92,246,0.15), rgba(59,130,246,0.1));
-                border: 2px solid rgba(139,92,246,0.4);
-                border-radius: 16px;
-                padding: 20px 24px;
-                margin: 12px 0;
-            }
-            .next-up-card .next-label {
-                color: #a78bfa;
-                font-size: 0.75rem;
-                font-weight: 700;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            .next-up-card .next-caption {
-                color: #e2e8f0;
-                font-size: 1rem;
-                line-height: 1.5;
-                margin: 8px 0;
-                white-space: pre-wrap;
-                word-break: break-word;
-            }
-            .next-up-card .next-meta {
-                color: #94a3b8;
-                font-size: 0.85rem;
-                margin-top: 8px;
-            }
-            .countdown {
-                color: #a78bfa;
-                font-size: 1.1rem;
-                font-weight: 700;
-            }
-            .queue-card {
-                background: rgba(30,30,46,0.5);
-                border: 1px solid rgba(255,255,255,0.06);
-                border-radius: 10px;
-                padding: 12px 16px;
-                margin: 4px 0;
-            }
-            .queue-card .q-platform { color: #94a3b8; font-size: 0.75rem; text-transform: uppercase; }
-            .queue-card .q-caption { color: #e2e8f0; font-size: 0.9rem; margin: 4px 0; }
-            .queue-card .q-meta { color: #64748b; font-size: 0.78rem; }
-            .history-card {
-                background: rgba(255,255,255,0.02);
-                border: 1px solid rgba(255,255,255,0.05);
-                border-radius: 8px;
-                padding: 10px 14px;
-                margin: 3px 0;
-            }
-            .history-card.posted { border-left: 3px solid #10b981; }
-            .history-card.failed { border-left: 3px solid #ef4444; }
-            .acct-stats {
-                display: flex; gap: 1rem; margin: 0.5rem 0 1rem 0;
-            }
-            .acct-stat {
-                padding: 0.5rem 1rem; border-radius: 8px;
-                background: rgba(255,255,255,0.03); border: 1px solid rgba(255,255,255,0.06);
-                text-align: center; font-size: 0.8rem; color: #94a3b8;
-            }
-            .acct-stat .num { font-size: 1.3rem; font-weight: 700; display: block; }
-            .acct-stat .num.pending { color: #facc15; }
-            .acct-stat .num.posted { color: #10b981; }
-            .acct-stat .num.failed { color: #ef4444; }
-            .reply-badge {
-                display: inline-block; background: rgba(29,161,242,0.15);
-                color: #1da1f2; padding: 2px 8px; border-radius: 10px;
-                font-size: 0.7rem; font-weight: 600; margin-left: 6px;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        grouped = fetch_scheduled()
+        all_pending = grouped["pending"]
+        all_posted = grouped["posted"]
+        all_failed = grouped["failed"]
+        all_posts = all_pending + all_posted + all_failed
+        # One clock read per render: countdowns and picker fallbacks all measure against it
+        now_utc = datetime.now(timezone.utc)
+        now_ist = now_utc.astimezone(IST)
+
+        st.markdown(SCHEDULE_CSS, unsafe_allow_html=True)
 
         # ── Global Summary Bar ───────────────────────────────────────────
         st.markdown(f"""
@@ -1192,37 +1597,66 @@ elif page == "📅 Schedule Manager":
         </div>
         """, unsafe_allow_html=True)
 
+        # ── Background jobs (Publish Due Now / Retry All) ────────────────
+        def _start_job(label, fn, done_msg):
+            """Run fn() on a daemon thread; the worker only touches the plain job dict, never st.*."""
+            # Buttons are only disabled from the next run on, so a quick second click lands here
+            if "_sched_job" in st.session_state:
+                return
+            job = {"label": label, "done_msg": done_msg, "done": False, "result": None, "error": None}
+
+            def _work():
+                try:
+                    job["result"] = fn()
+                except Exception as e:
+                    job["error"] = e
+                finally:
+                    job["done"] = True
+
+            st.session_state["_sched_job"] = job
+            threading.Thread(target=_work, daemon=True).start()
+
+        @st.fragment(run_every=1)
+        def _job_poller():
+            """Poll the running job; on completion drop the cache and rerun the whole page."""
+            job = st.session_state.get("_sched_job")
+            if job is None:
+                return
+            if not job["done"]:
+                st.info(f"{job['label']} in the background…")
+                return
+            del st.session_state["_sched_job"]
+            fetch_scheduled.clear()
+            st.toast(f"❌ {job['error']}" if job["error"] else job["done_msg"](job["result"]))
+            st.rerun(scope="app")
+
         # ── Global Action Buttons ────────────────────────────────────────
+        job_running = "_sched_job" in st.session_state
         col_refresh, col_publish, col_retry_all = st.columns(3)
         with col_refresh:
             if st.button("🔄 Refresh", use_container_width=True):
+                fetch_scheduled.clear()
                 st.rerun()
         with col_publish:
-            if st.button("⚡ Publish Due Now", use_container_width=True, type="primary"):
-                with st.spinner("⚡ Publishing due posts..."):
-                    try:
-                        from modules.scheduler.auto_publisher import publish_due_posts
-                        pub, fail = publish_due_posts()
-                        if pub or fail:
-                            st.success(f"✅ Published: {pub} | Failed: {fail}")
-                        else:
-                            st.info("📭 No posts are due right now.")
-                        time.sleep(1)
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ {e}")
+            if st.button("⚡ Publish Due Now", use_container_width=True, type="primary",
+                         disabled=job_running):
+                _start_job(
+                    "⚡ Publishing due posts",
+                    _auto_publisher().publish_due_posts,
+                    lambda r: f"✅ Published: {r[0]} | Failed: {r[1]}" if any(r) else "📭 No posts are due right now.",
+                )
         with col_retry_all:
-            retry_disabled = len(all_failed) == 0
             if st.button(f"🔄 Retry All Failed ({len(all_failed)})", use_container_width=True,
-                         disabled=retry_disabled):
-                with st.spinner("🔄 Retrying all failed posts..."):
-                    try:
-                        count = retry_all_failed()
-                        st.success(f"✅ Reset {count} post(s) to pending — they'll publish shortly")
-                        time.sleep(1)
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ {e}")
+                         disabled=job_running or not all_failed):
+                _start_job(
+                    "🔄 Retrying all failed posts",
+                    retry_all_failed,
+                    lambda n: f"✅ Reset {n} post(s) to pending — they'll publish shortly",
+                )
+
+        # Only mounted while a job exists, so the 1s poll stops once it finishes
+        if "_sched_job" in st.session_state:
+            _job_poller()
 
         st.markdown("---")
 
@@ -1231,12 +1665,7 @@ elif page == "📅 Schedule Manager":
             if not iso_string:
                 return ""
             try:
-                dt = _parse_dt(iso_string)
-                if dt.tzinfo is None:
-                    dt = pytz.utc.localize(dt)
-                now = datetime.now(pytz.utc)
-                diff = dt - now
-                secs = int(diff.total_seconds())
+                secs = int((_parse_iso(iso_string) - now_utc).total_seconds())
                 if secs <= 0:
                     return "⚡ Due now!"
                 if secs < 60:
@@ -1252,21 +1681,57 @@ elif page == "📅 Schedule Manager":
             except Exception:
                 return ""
 
+        # ── Helper: reschedule / cancel row ──────────────────────────────
+        @st.fragment
+        def _edit_row(post, prefix, set_label="⏰", cancel_label="🗑️"):
+            """Date/time pickers plus Set/Cancel for one pending post.
+
+            Runs as a fragment so picker changes rerun only this row; Set/Cancel
+            trigger a full-app rerun to refresh the timeline.
+            """
+            try:
+                _ist = _parse_iso(post["scheduled_time"]).astimezone(IST)
+                _dd = _ist.date()
+                _dt_time = _ist.time().replace(second=0, microsecond=0)
+            except Exception:
+                _dd = now_ist.date()
+                _dt_time = now_ist.time().replace(second=0, microsecond=0)
+
+            c1, c2, c3, c4 = st.columns([2, 2, 1, 1])
+            with c1:
+                new_date = st.date_input("Date", value=_dd,
+                    key=f"{prefix}_date_{post['id']}", label_visibility="collapsed")
+            with c2:
+                new_time = st.time_input("Time", value=_dt_time,
+                    key=f"{prefix}_time_{post['id']}", step=timedelta(minutes=30),
+                    label_visibility="collapsed")
+            with c3:
+                if st.button(set_label, key=f"{prefix}_set_{post['id']}", type="primary"):
+                    try:
+                        new_dt = datetime.combine(new_date, new_time, tzinfo=IST)
+                        update_schedule_time(post["id"], new_dt)
+                        st.toast(f"✅ → {new_dt.strftime('%b %d, %I:%M %p IST')}")
+                        st.rerun(scope="app")
+                    except Exception as e:
+                        st.error(f"Failed: {e}")
+            with c4:
+                if st.button(cancel_label, key=f"{prefix}_cancel_{post['id']}"):
+                    try:
+                        delete_schedule(post["id"])
+                        st.toast("Cancelled"); st.rerun(scope="app")
+                    except Exception as e:
+                        st.error(f"Failed: {e}")
+
         # ── Helper: render account timeline ──────────────────────────────
         def _render_account_timeline(posts, account_name, platform_prefix):
             """Render the Next Up → Queue → History timeline for one account."""
-            pending = sorted(
-                [p for p in posts if p.get("status") == "pending"],
-                key=lambda p: p.get("scheduled_time", ""),
-            )
-            posted = sorted(
-                [p for p in posts if p.get("status") == "posted"],
-                key=lambda p: p.get("posted_at", ""), reverse=True,
-            )
-            failed = sorted(
-                [p for p in posts if p.get("status") == "failed"],
-                key=lambda p: p.get("scheduled_time", ""), reverse=True,
-            )
+            # Rows arrive ordered by scheduled_time ascending: pending is queue-ordered, failed tail is newest
+            buckets = defaultdict(list)
+            for p in posts:
+                buckets[p.get("status")].append(p)
+            pending = buckets["pending"]
+            posted = buckets["posted"]
+            failed = buckets["failed"]
 
             # Per-account stats
             st.markdown(f"""
@@ -1281,10 +1746,10 @@ elif page == "📅 Schedule Manager":
             if pending:
                 next_post = pending[0]
                 plat = next_post.get("platform", "unknown")
-                icon = PLATFORM_ICONS.get(plat, "📝")
-                label = PLATFORM_LABELS.get(plat, plat)
+                icon = _platform_icon(plat, "📝")
+                label = _platform_label(plat, plat)
                 caption = next_post.get("caption") or "(no caption)"
-                caption_display = caption[:300] + ("…" if len(caption) > 300 else "")
+                caption_display = _html_ell(caption, 300)
                 sched_time = format_time_ist(next_post.get("scheduled_time"))
                 cd = _countdown(next_post.get("scheduled_time"))
                 reply_id = next_post.get("reply_to_tweet_id")
@@ -1302,41 +1767,7 @@ elif page == "📅 Schedule Manager":
                 """, unsafe_allow_html=True)
 
                 # Reschedule / Cancel for NEXT UP
-                try:
-                    _current_dt = _parse_dt(next_post["scheduled_time"])
-                    if _current_dt.tzinfo is None:
-                        _current_dt = pytz.utc.localize(_current_dt)
-                    _current_ist = _current_dt.astimezone(IST)
-                    _default_date = _current_ist.date()
-                    _default_time = _current_ist.time().replace(second=0, microsecond=0)
-                except Exception:
-                    _default_date = datetime.now(IST).date()
-                    _default_time = datetime.now(IST).time().replace(second=0, microsecond=0)
-
-                c1, c2, c3, c4 = st.columns([2, 2, 1, 1])
-                with c1:
-                    new_date = st.date_input("Date", value=_default_date,
-                        key=f"next_date_{next_post['id']}", label_visibility="collapsed")
-                with c2:
-                    new_time = st.time_input("Time", value=_default_time,
-                        key=f"next_time_{next_post['id']}", step=timedelta(minutes=30),
-                        label_visibility="collapsed")
-                with c3:
-                    if st.button("⏰ Set", key=f"next_set_{next_post['id']}", type="primary"):
-                        try:
-                            new_dt = IST.localize(datetime.combine(new_date, new_time))
-                            update_schedule_time(next_post["id"], new_dt)
-                            st.success(f"✅ → {new_dt.strftime('%b %d, %I:%M %p IST')}")
-                            time.sleep(0.5); st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
-                with c4:
-                    if st.button("🗑️ Cancel", key=f"next_cancel_{next_post['id']}"):
-                        try:
-                            delete_schedule(next_post["id"])
-                            st.success("Cancelled"); time.sleep(0.5); st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
+                _edit_row(next_post, "next", set_label="⏰ Set", cancel_label="🗑️ Cancel")
 
             else:
                 st.info("📭 No upcoming posts for this account.")
@@ -1344,77 +1775,35 @@ elif page == "📅 Schedule Manager":
             # ── 📅 UPCOMING QUEUE ────────────────────────────────────
             if len(pending) > 1:
                 st.markdown("#### 📅 Upcoming Queue")
-                for post in pending[1:]:
+                for i, post in enumerate(pending[1:], 2):
                     plat = post.get("platform", "unknown")
-                    icon = PLATFORM_ICONS.get(plat, "📝")
-                    label = PLATFORM_LABELS.get(plat, plat)
-                    caption = (post.get("caption") or "")[:120]
-                    sched = format_time_ist(post.get("scheduled_time"))
-                    cd = _countdown(post.get("scheduled_time"))
-                    reply_id = post.get("reply_to_tweet_id")
-                    reply_html = f'<span class="reply-badge">↩️ Reply</span>' if reply_id else ""
-
-                    st.markdown(f"""
-                    <div class="queue-card">
-                        <div class="q-platform">{icon} {label} {reply_html}</div>
-                        <div class="q-caption">{caption}{"…" if len(post.get("caption", "")) > 120 else ""}</div>
-                        <div class="q-meta">📅 {sched} &nbsp;•&nbsp; ⏳ {cd}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    try:
-                        _dt = _parse_dt(post["scheduled_time"])
-                        if _dt.tzinfo is None:
-                            _dt = pytz.utc.localize(_dt)
-                        _ist = _dt.astimezone(IST)
-                        _dd = _ist.date()
-                        _dt_time = _ist.time().replace(second=0, microsecond=0)
-                    except Exception:
-                        _dd = datetime.now(IST).date()
-                        _dt_time = datetime.now(IST).time().replace(second=0, microsecond=0)
-
-                    qc1, qc2, qc3, qc4 = st.columns([2, 2, 1, 1])
+                    sched_iso = post.get("scheduled_time")
+                    qc1, qc2 = st.columns([6, 1], vertical_alignment="center")
                     with qc1:
-                        q_date = st.date_input("Date", value=_dd,
-                            key=f"q_date_{post['id']}", label_visibility="collapsed")
+                        st.markdown(QUEUE_CARD_TPL.format_map({
+                            "icon": _platform_icon(plat, "📝"),
+                            "label": _platform_label(plat, plat),
+                            "reply_html": '<span class="reply-badge">↩️ Reply</span>' if post.get("reply_to_tweet_id") else "",
+                            "caption": _html_ell(post.get("caption") or "", 120),
+                            "sched": format_time_ist(sched_iso),
+                            "countdown": _countdown(sched_iso),
+                        }), unsafe_allow_html=True)
                     with qc2:
-                        q_time = st.time_input("Time", value=_dt_time,
-                            key=f"q_time_{post['id']}", step=timedelta(minutes=30),
-                            label_visibility="collapsed")
-                    with qc3:
-                        if st.button("⏰", key=f"q_set_{post['id']}"):
-                            try:
-                                new_dt = IST.localize(datetime.combine(q_date, q_time))
-                                update_schedule_time(post["id"], new_dt)
-                                st.success(f"✅ → {new_dt.strftime('%b %d, %I:%M %p')}"); time.sleep(0.5); st.rerun()
-                            except Exception as e:
-                                st.error(f"Failed: {e}")
-                    with qc4:
-                        if st.button("🗑️", key=f"q_cancel_{post['id']}"):
-                            try:
-                                delete_schedule(post["id"])
-                                st.success("Cancelled"); time.sleep(0.5); st.rerun()
-                            except Exception as e:
-                                st.error(f"Failed: {e}")
+                        # Reschedule / cancel sit beside their card, folded away until opened
+                        with st.popover("⏰", help=f"Reschedule or cancel #{i}"):
+                            _edit_row(post, "q")
 
             # ── ⏪ History (collapsible) ──────────────────────────────
             history_label = f"⏪ History ({len(posted)} posted, {len(failed)} failed)"
             with st.expander(history_label, expanded=False):
                 if posted:
                     st.markdown("##### ✅ Posted")
-                    for post in posted[:20]:
-                        plat = post.get("platform", "unknown")
-                        icon = PLATFORM_ICONS.get(plat, "📝")
-                        caption = (post.get("caption") or "")[:100]
-                        posted_at = format_time_ist(post.get("posted_at"))
-
-                        st.markdown(f"""
-                        <div class="history-card posted">
-                            <span style="color:#10b981;font-weight:600;">✅ {icon}</span>
-                            <span style="color:#e2e8f0;font-size:0.9rem;">{caption}{"…" if len(post.get("caption", "")) > 100 else ""}</span>
-                            <br><span style="color:#64748b;font-size:0.75rem;">📅 {posted_at}</span>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    for post in heapq.nlargest(20, posted, key=lambda p: p.get("posted_at") or ""):
+                        st.markdown(POSTED_CARD_TPL.format_map({
+                            "icon": _platform_icon(post.get("platform"), "📝"),
+                            "caption": _html_ell(post.get("caption") or "", 100),
+                            "posted_at": format_time_ist(post.get("posted_at")),
+                        }), unsafe_allow_html=True)
 
                         hc1, _ = st.columns([1, 5])
                         with hc1:
@@ -1423,33 +1812,26 @@ elif page == "📅 Schedule Manager":
 
                 if failed:
                     st.markdown("##### ❌ Failed")
-                    for post in failed[:10]:
-                        plat = post.get("platform", "unknown")
-                        icon = PLATFORM_ICONS.get(plat, "📝")
-                        caption = (post.get("caption") or "")[:100]
-                        error_msg = post.get("error_message", "Unknown error")
-
-                        st.markdown(f"""
-                        <div class="history-card failed">
-                            <span style="color:#ef4444;font-weight:600;">❌ {icon}</span>
-                            <span style="color:#e2e8f0;font-size:0.9rem;">{caption}{"…" if len(post.get("caption", "")) > 100 else ""}</span>
-                            <br><span style="color:#fca5a5;font-size:0.75rem;font-family:monospace;">⚠️ {error_msg[:150]}</span>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                        fc1, fc2, _ = st.columns([1, 1, 4])
+                    for post in failed[:-11:-1]:
+                        fc0, fc1, fc2 = st.columns([4, 1, 1], vertical_alignment="center")
+                        with fc0:
+                            st.markdown(FAILED_CARD_TPL.format_map({
+                                "icon": _platform_icon(post.get("platform"), "📝"),
+                                "caption": _html_ell(post.get("caption") or "", 100),
+                                "error": html.escape((post.get("error_message") or "Unknown error")[:150]),
+                            }), unsafe_allow_html=True)
                         with fc1:
                             if st.button("🔄 Retry", key=f"hretry_{post['id']}", type="primary"):
                                 try:
                                     retry_failed(post["id"])
-                                    st.success("✅ Reset to pending"); time.sleep(0.5); st.rerun()
+                                    st.toast("✅ Reset to pending"); st.rerun()
                                 except Exception as e:
                                     st.error(f"Failed: {e}")
                         with fc2:
                             if st.button("🗑️", key=f"hfail_del_{post['id']}"):
                                 try:
                                     delete_schedule(post["id"])
-                                    st.success("Deleted"); time.sleep(0.5); st.rerun()
+                                    st.toast("Deleted"); st.rerun()
                                 except Exception as e:
                                     st.error(f"Failed: {e}")
 
@@ -1457,8 +1839,14 @@ elif page == "📅 Schedule Manager":
                     st.info("No history yet for this account.")
 
         # ── Build account lists dynamically ──────────────────────────────
-        twitter_accounts = sorted({p["twitter_account"] for p in all_posts if p.get("twitter_account")})
-        instagram_accounts = sorted({p["instagram_account"] for p in all_posts if p.get("instagram_account")})
+        posts_by_tw, posts_by_ig = defaultdict(list), defaultdict(list)
+        for p in all_posts:
+            if p.get("twitter_account"):
+                posts_by_tw[p["twitter_account"]].append(p)
+            if p.get("instagram_account"):
+                posts_by_ig[p["instagram_account"]].append(p)
+        twitter_accounts = sorted(posts_by_tw)
+        instagram_accounts = sorted(posts_by_ig)
 
         # ── Platform Tabs ────────────────────────────────────────────────
         tab_twitter, tab_instagram = st.tabs(["🐦 Twitter", "📸 Instagram"])
@@ -1470,8 +1858,7 @@ elif page == "📅 Schedule Manager":
                 account_tabs = st.tabs(twitter_accounts)
                 for account_tab, account_name in zip(account_tabs, twitter_accounts):
                     with account_tab:
-                        account_posts = [p for p in all_posts if p.get("twitter_account") == account_name]
-                        _render_account_timeline(account_posts, account_name, "tw")
+                        _render_account_timeline(posts_by_tw[account_name], account_name, "tw")
 
         with tab_instagram:
             if not instagram_accounts:
@@ -1480,8 +1867,7 @@ elif page == "📅 Schedule Manager":
                 ig_tabs = st.tabs(instagram_accounts)
                 for ig_tab, ig_name in zip(ig_tabs, instagram_accounts):
                     with ig_tab:
-                        ig_posts = [p for p in all_posts if p.get("instagram_account") == ig_name]
-                        _render_account_timeline(ig_posts, ig_name, "ig")
+                        _render_account_timeline(posts_by_ig[ig_name], ig_name, "ig")
 
     except Exception as e:
         st.warning(f"⚠️ Schedule Manager unavailable: {e}")
@@ -1522,7 +1908,6 @@ elif page == "📰 Daily News Jokes":
             st.session_state.news_jokes = {}
             st.session_state.news_pipeline_done = False
             st.session_state.news_pipeline_log = ""
-            st.rerun()
 
     if run_news_btn:
         log_lines = []
@@ -1530,8 +1915,7 @@ elif page == "📰 Daily News Jokes":
         # Step 1: Fetch headlines
         with st.spinner("📰 Fetching trending headlines..."):
             try:
-                from modules.news_workflow.news_fetcher import fetch_top_headlines
-                headlines = fetch_top_headlines()
+                headlines = _news_fetcher().fetch_top_headlines()
                 st.session_state.news_headlines = headlines
                 log_lines.append(f"✅ Fetched {len(headlines)} headlines")
                 for i, h in enumerate(headlines, 1):
@@ -1540,28 +1924,40 @@ elif page == "📰 Daily News Jokes":
                 st.error(f"❌ News fetch failed: {e}")
                 st.stop()
 
-        # Step 2: Generate jokes for each headline
-        all_jokes = {}
-        from modules.joke_generator.campaign_generator import search_bridges, generate_from_selected
+        # Step 2: Generate jokes for each headline — searches and LLM calls are
+        # independent and network-bound (embedding + RPC + LLM), so run them concurrently.
+        generate_from_selected_batch = _campaign_generator().generate_from_selected_batch
+        headlines = st.session_state.news_headlines
 
-        for idx, headline in enumerate(st.session_state.news_headlines):
-            with st.spinner(f"🔍 [{idx+1}/{len(st.session_state.news_headlines)}] Searching bridges for: {headline[:50]}..."):
-                try:
-                    matches = search_bridges(headline, top_k=15)
-                    log_lines.append(f"\n🔍 Headline {idx+1}: \"{headline}\" → {len(matches)} bridges found")
-                except Exception as e:
-                    log_lines.append(f"\n❌ Search failed for '{headline}': {e}")
-                    all_jokes[headline] = []
-                    continue
-
-            with st.spinner(f"🔥 [{idx+1}/{len(st.session_state.news_headlines)}] Generating 10 jokes for: {headline[:50]}..."):
-                try:
-                    jokes = generate_from_selected(headline, matches[:10])
-                    all_jokes[headline] = jokes
-                    log_lines.append(f"   ✅ Generated {len(jokes)} jokes")
-                except Exception as e:
-                    log_lines.append(f"   ❌ Generation failed: {e}")
-                    all_jokes[headline] = []
+        all_jokes = {}
+        with st.spinner(f"🔥 Searching bridges & generating jokes for {len(headlines)} headlines..."):
+            # One batched embedding request for every headline; theme expansion + RPCs fan out inside
+            try:
+                matches_by_headline, search_errors = search_bridges_many_cached(tuple(headlines), top_k=15)
+                searches = [(matches_by_headline.get(h, []), search_errors.get(h)) for h in headlines]
+            except Exception as e:
+                searches = [([], e)] * len(headlines)
+            # Every headline's top-10 bridges go into one generation pool instead of N serial loops
+            try:
+                jokes_by_headline = generate_from_selected_batch(
+                    [(h, matches[:10]) for h, (matches, err) in zip(headlines, searches) if err is None]
+                )
+                gen_error = None
+            except Exception as e:
+                jokes_by_headline, gen_error = {}, e
+
+        # Log in headline order, so it reads the same as a sequential run
+        for idx, (headline, (matches, err)) in enumerate(zip(headlines, searches), 1):
+            if err is not None:
+                log_lines.append(f"\n❌ Search failed for '{headline}': {err}")
+                all_jokes[headline] = []
+                continue
+            log_lines.append(f"\n🔍 Headline {idx}: \"{headline}\" → {len(matches)} bridges found")
+            all_jokes[headline] = jokes = jokes_by_headline.get(headline, [])
+            if gen_error is not None:
+                log_lines.append(f"   ❌ Generation failed: {gen_error}")
+            else:
+                log_lines.append(f"   ✅ Generated {len(jokes)} jokes")
 
         st.session_state.news_jokes = all_jokes
         total_jokes = sum(len(j) for j in all_jokes.values())
@@ -1571,15 +1967,14 @@ elif page == "📰 Daily News Jokes":
         # Step 3: Send notifications
         with st.spinner("📨 Sending notifications via Telegram & Email..."):
             try:
-                from modules.news_workflow.notifier import notify_jokes
-                notify_jokes(st.session_state.news_headlines, all_jokes)
+                _notifier().notify_jokes(st.session_state.news_headlines, all_jokes)
                 log_lines.append("✅ Notifications sent (Telegram + Email)")
             except Exception as e:
                 log_lines.append(f"⚠️ Notification failed: {e}")
 
         st.session_state.news_pipeline_log = "\n".join(log_lines)
         st.session_state.news_pipeline_done = True
-        st.rerun()
+        # No st.rerun(): the results block below renders from session_state in this same run
 
     # Display results
     if st.session_state.news_pipeline_done:
@@ -1593,25 +1988,22 @@ elif page == "📰 Daily News Jokes":
         # Show jokes by headline
         for headline, jokes in st.session_state.news_jokes.items():
             with st.expander(f"📰 {headline} ({len(jokes)} jokes)", expanded=False):
-                for i, joke_data in enumerate(jokes):
-                    st.markdown(f"""
-                    <div class="joke-card">
-                        <div class="joke-text">{joke_data.get('joke', 'N/A')}</div>
-                        <div class="joke-meta">
-                            <span class="badge">#{i+1}</span>
-                            <span>{joke_data.get('engine', '?')}</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                st.markdown("".join(
+                    f'<div class="joke-card">'
+                    f'<div class="joke-text">{joke_data.get("joke", "N/A")}</div>'
+                    f'<div class="joke-meta">'
+                    f'<span class="badge">#{i+1}</span>'
+                    f'<span>{joke_data.get("engine", "?")}</span>'
+                    f'</div></div>'
+                    for i, joke_data in enumerate(jokes)
+                ), unsafe_allow_html=True)
 
     elif st.session_state.news_headlines:
         st.markdown("### 📰 Last Fetched Headlines")
-        for i, headline in enumerate(st.session_state.news_headlines, 1):
-            st.markdown(f"""
-            <div class="headline-card">
-                <span class="title">{i}. {headline}</span>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            f'<div class="headline-card"><span class="title">{i}. {headline}</span></div>'
+            for i, headline in enumerate(st.session_state.news_headlines, 1)
+        ), unsafe_allow_html=True)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1652,6 +2044,11 @@ elif page == "🐦 Tweet Reply Studio":
     </style>
     """, unsafe_allow_html=True)
 
+    # Resolved once per page render, not per tweet/joke row below
+    trends = _trends_fetcher()
+    open_schedulers = st.session_state.open_schedulers
+    schedule_errors = st.session_state.schedule_errors
+
     tab_trending, tab_manual = st.tabs(["🔥 Trending Jokes", "🔍 Manual Search"])
 
     # ── TAB 1: TRENDING JOKES (pre-generated) ────────────────────────────
@@ -1660,8 +2057,7 @@ elif page == "🐦 Tweet Reply Studio":
 
         # Account selector — AT THE TOP so user always sees it
         try:
-            from modules.twitter.twitter_client import get_available_accounts
-            available_accounts = get_available_accounts()
+            available_accounts = list_twitter_accounts()
         except Exception:
             available_accounts = ["account_1"]
 
@@ -1673,9 +2069,7 @@ elif page == "🐦 Tweet Reply Studio":
         st.markdown("---")
 
         try:
-            from modules.news_workflow.twitter_trends_fetcher import load_latest_results
-
-            results = load_latest_results()
+            results = load_trending_results()
             if results:
                 gen_time = results.get("generated_at", "")[:19]
                 topics = results.get("topics", [])
@@ -1693,56 +2087,46 @@ elif page == "🐦 Tweet Reply Studio":
 
                     with st.expander(f"🐦 {trend_name} — {len(jokes)} jokes", expanded=False):
                         # Show the source tweet
-                        st.markdown(f"""
-                        <div class="tweet-card">
-                            <span class="trend-badge">{trend_name}</span>
-                            <div class="tweet-author">{tweet.get('author_name', '')}
-                                <span class="tweet-handle">@{tweet.get('author', '')}</span>
-                            </div>
-                            <div class="tweet-text">{tweet.get('text', '')}</div>
-                            <div class="tweet-stats">
-                                ❤️ {tweet.get('likes', 0):,} &nbsp;·&nbsp;
-                                🔁 {tweet.get('retweets', 0):,} &nbsp;·&nbsp;
-                        👁️ {tweet.get('views', 0):,} &nbsp;·&nbsp;
-                                🕐 {tweet.get('tweet_age', '')}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                        st.markdown(f"[🔗 Open on X →]({tweet.get('url', '')})")
+                        # Source tweet and its link go out as one element
+                        st.markdown(
+                            f'<div class="tweet-card">'
+                            f'<span class="trend-badge">{html.escape(trend_name)}</span>'
+                            f'<div class="tweet-author">{html.escape(tweet.get("author_name", ""))} '
+                            f'<span class="tweet-handle">@{html.escape(tweet.get("author", ""))}</span></div>'
+                            f'<div class="tweet-text">{html.escape(tweet.get("text", ""))}</div>'
+                            f'<div class="tweet-stats">'
+                            f'❤️ {tweet.get("likes", 0):,} &nbsp;·&nbsp; '
+                            f'🔁 {tweet.get("retweets", 0):,} &nbsp;·&nbsp; '
+                            f'👁️ {tweet.get("views", 0):,} &nbsp;·&nbsp; '
+                            f'🕐 {html.escape(str(tweet.get("tweet_age", "")))}'
+                            f'</div></div>'
+                            f'<a href="{html.escape(tweet.get("url", ""))}" target="_blank">🔗 Open on X →</a>',
+                            unsafe_allow_html=True,
+                        )
 
                         # Show jokes with reply buttons
                         for j_idx, joke_data in enumerate(jokes):
                             joke_text = joke_data.get("joke", "N/A")
                             engine = joke_data.get("engine", "?")
 
-                            st.markdown(f'<div class="joke-meta">{engine} • generated joke:</div>',
-                                        unsafe_allow_html=True)
-
-                            # Editable text area pre-filled with the joke
+                            # Editable text area pre-filled with the joke; the label carries the
+                            # engine line and max_chars gives Streamlit's own n/280 counter
                             edited_text = st.text_area(
-                                f"✍️ Edit joke before replying",
+                                f"{engine} • generated joke:",
                                 value=joke_text,
                                 max_chars=280,
                                 key=f"jedit_{t_idx}_{j_idx}",
                                 height=80,
-                                label_visibility="collapsed",
                             )
 
-                            char_count = len(edited_text) if edited_text else 0
-                            char_color = "#10b981" if char_count <= 280 else "#ef4444"
-                            st.markdown(f'<span style="color:{char_color};font-size:0.75rem;">{char_count}/280</span>',
-                                       unsafe_allow_html=True)
-
                             col_reply, col_sched = st.columns(2)
 
                             with col_reply:
                                 if st.button("🚀 Reply Now", key=f"treply_{t_idx}_{j_idx}", type="primary",
                                             disabled=not edited_text):
                                     try:
-                                        from modules.twitter.twitter_client import TwitterClient
                                         account = st.session_state.get("reply_account", "account_1")
-                                        client = TwitterClient(account_name=account)
+                                        client = get_twitter_client(account)
                                         result = client.post_tweet(edited_text, reply_to_tweet_id=tweet.get("id"))
                                         st.success(f"✅ Reply posted! Tweet ID: {result.get('id', 'unknown')}")
                                     except Exception as e:
@@ -1757,41 +2141,28 @@ elif page == "🐦 Tweet Reply Studio":
                             with col_sched:
                                 if st.button("📅 Schedule", key=f"tsched_{t_idx}_{j_idx}",
                                             disabled=not edited_text):
-                                    st.session_state[f"show_sched_{t_idx}_{j_idx}"] = True
+                                    open_schedulers.add((t_idx, j_idx))
 
                             # Show schedule form if toggled
-                            if st.session_state.get(f"show_sched_{t_idx}_{j_idx}", False):
-                                try:
-                                    import pytz
-                                    IST = pytz.timezone("Asia/Kolkata")
-                                    from modules.scheduler.scheduler_db import insert_schedule
-                                    from modules.scheduler.slot_calculator import get_next_slot
-
-                                    s_col1, s_col2, s_col3 = st.columns([2, 2, 1])
-                                    with s_col1:
-                                        s_date = st.date_input("Date", key=f"sd_{t_idx}_{j_idx}",
-                                                               label_visibility="collapsed")
-                                    with s_col2:
-                                        s_time = st.time_input("Time", key=f"st_{t_idx}_{j_idx}",
-                                                               step=timedelta(minutes=30),
-                                                               label_visibility="collapsed")
-                                    with s_col3:
-                                        if st.button("✅ Confirm", key=f"sconf_{t_idx}_{j_idx}", type="primary"):
-                                            sched_dt = IST.localize(datetime.combine(s_date, s_time))
-                                            account = st.session_state.get("reply_account", "account_1")
-                                            insert_schedule(
-                                                platform="twitter_text",
-                                                video_url=None,
-                                                caption=edited_text,
-                                                scheduled_time=sched_dt,
-                                                twitter_account=account,
-                                                reply_to_tweet_id=tweet.get("id"),
-                                            )
-                                            st.success(f"✅ Scheduled for {sched_dt.strftime('%b %d, %I:%M %p IST')}")
-                                            del st.session_state[f"show_sched_{t_idx}_{j_idx}"]
-                                            time.sleep(0.5); st.rerun()
-                                except Exception as e:
-                                    st.error(f"Schedule error: {e}")
+                            if (t_idx, j_idx) in open_schedulers:
+                                s_col1, s_col2, s_col3 = st.columns([2, 2, 1])
+                                with s_col1:
+                                    st.date_input("Date", key=f"sd_{t_idx}_{j_idx}",
+                                                  label_visibility="collapsed")
+                                with s_col2:
+                                    st.time_input("Time", key=f"st_{t_idx}_{j_idx}",
+                                                  step=timedelta(minutes=30),
+                                                  label_visibility="collapsed")
+                                with s_col3:
+                                    st.button(
+                                        "✅ Confirm", key=f"sconf_{t_idx}_{j_idx}", type="primary",
+                                        on_click=_confirm_reply_schedule,
+                                        args=((t_idx, j_idx), f"jedit_{t_idx}_{j_idx}", tweet.get("id"),
+                                              f"sd_{t_idx}_{j_idx}", f"st_{t_idx}_{j_idx}", "reply_account"),
+                                    )
+                                sched_err = schedule_errors.pop((t_idx, j_idx), None)
+                                if sched_err:
+                                    st.error(f"Schedule error: {sched_err}")
 
                 # Account selector for replies
 
@@ -1807,8 +2178,7 @@ elif page == "🐦 Tweet Reply Studio":
 
         # Account selector — AT THE TOP so user always sees it
         try:
-            from modules.twitter.twitter_client import get_available_accounts
-            available_accounts_m = get_available_accounts()
+            available_accounts_m = list_twitter_accounts()
         except Exception:
             available_accounts_m = ["account_1"]
 
@@ -1826,8 +2196,7 @@ elif page == "🐦 Tweet Reply Studio":
         if st.button("🔍 Search", type="primary", disabled=not search_query):
             with st.spinner(f"🔍 Searching tweets for: {search_query}..."):
                 try:
-                    from modules.news_workflow.twitter_trends_fetcher import search_tweets_manual
-                    results = search_tweets_manual(search_query, count=10)
+                    results = trends.search_tweets_manual(search_query, count=10)
                     st.session_state.manual_search_results = results
                     st.session_state.manual_search_query = search_query
                 except Exception as e:
@@ -1840,23 +2209,21 @@ elif page == "🐦 Tweet Reply Studio":
             st.success(f"Found **{len(results)}** tweets for \"{st.session_state.get('manual_search_query', '')}\"")
 
             for m_idx, tweet in enumerate(results):
-                st.markdown(f"""
-                <div class="tweet-card">
-                    <div class="tweet-author">{tweet.get('author_name', '')}
-                        <span class="tweet-handle">@{tweet.get('author', '')}</span>
-                    </div>
-                    <div class="tweet-text">{tweet.get('text', '')}</div>
-                    <div class="tweet-stats">
-                        ❤️ {tweet.get('likes', 0):,} &nbsp;·&nbsp;
-                        🔁 {tweet.get('retweets', 0):,} &nbsp;·&nbsp;
-                        👁️ {tweet.get('views', 0):,}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-                st.markdown(f"[🔗 Open on X →]({tweet.get('url', '')})")
+                st.markdown(
+                    f'<div class="tweet-card">'
+                    f'<div class="tweet-author">{html.escape(tweet.get("author_name", ""))} '
+                    f'<span class="tweet-handle">@{html.escape(tweet.get("author", ""))}</span></div>'
+                    f'<div class="tweet-text">{html.escape(tweet.get("text", ""))}</div>'
+                    f'<div class="tweet-stats">'
+                    f'❤️ {tweet.get("likes", 0):,} &nbsp;·&nbsp; '
+                    f'🔁 {tweet.get("retweets", 0):,} &nbsp;·&nbsp; '
+                    f'👁️ {tweet.get("views", 0):,}'
+                    f'</div></div>'
+                    f'<a href="{html.escape(tweet.get("url", ""))}" target="_blank">🔗 Open on X →</a>',
+                    unsafe_allow_html=True,
+                )
 
-                # Reply compose section
+                # Reply compose section (max_chars shows Streamlit's own n/280 counter)
                 reply_text = st.text_area(
                     f"✍️ Reply to @{tweet.get('author', '')}",
                     max_chars=280,
@@ -1865,19 +2232,13 @@ elif page == "🐦 Tweet Reply Studio":
                     height=80,
                 )
 
-                char_count = len(reply_text) if reply_text else 0
-                char_color = "#10b981" if char_count <= 280 else "#ef4444"
-                st.markdown(f'<span style="color:{char_color};font-size:0.75rem;">{char_count}/280</span>',
-                           unsafe_allow_html=True)
-
                 mc1, mc2 = st.columns(2)
                 with mc1:
                     if st.button("🚀 Reply Now", key=f"m_reply_{m_idx}", type="primary",
                                 disabled=not reply_text):
                         try:
-                            from modules.twitter.twitter_client import TwitterClient
                             account = st.session_state.get("reply_account_manual", "account_1")
-                            client = TwitterClient(account_name=account)
+                            client = get_twitter_client(account)
                             result = client.post_tweet(reply_text, reply_to_tweet_id=tweet.get("id"))
                             st.success(f"✅ Reply posted! Tweet ID: {result.get('id', 'unknown')}")
                         except Exception as e:
@@ -1892,38 +2253,26 @@ elif page == "🐦 Tweet Reply Studio":
                 with mc2:
                     if st.button("📅 Schedule Reply", key=f"m_sched_{m_idx}",
                                 disabled=not reply_text):
-                        st.session_state[f"m_show_sched_{m_idx}"] = True
-
-                if st.session_state.get(f"m_show_sched_{m_idx}", False):
-                    try:
-                        import pytz
-                        IST = pytz.timezone("Asia/Kolkata")
-                        from modules.scheduler.scheduler_db import insert_schedule
-
-                        ms1, ms2, ms3 = st.columns([2, 2, 1])
-                        with ms1:
-                            m_date = st.date_input("Date", key=f"md_{m_idx}", label_visibility="collapsed")
-                        with ms2:
-                            m_time = st.time_input("Time", key=f"mt_{m_idx}",
-                                                    step=timedelta(minutes=30),
-                                                    label_visibility="collapsed")
-                        with ms3:
-                            if st.button("✅ Confirm", key=f"mconf_{m_idx}", type="primary"):
-                                sched_dt = IST.localize(datetime.combine(m_date, m_time))
-                                account = st.session_state.get("reply_account_manual", "account_1")
-                                insert_schedule(
-                                    platform="twitter_text",
-                                    video_url=None,
-                                    caption=reply_text,
-                                    scheduled_time=sched_dt,
-                                    twitter_account=account,
-                                    reply_to_tweet_id=tweet.get("id"),
-                                )
-                                st.success(f"✅ Scheduled for {sched_dt.strftime('%b %d, %I:%M %p IST')}")
-                                del st.session_state[f"m_show_sched_{m_idx}"]
-                                time.sleep(0.5); st.rerun()
-                    except Exception as e:
-                        st.error(f"Schedule error: {e}")
+                        open_schedulers.add(("manual", m_idx))
+
+                if ("manual", m_idx) in open_schedulers:
+                    ms1, ms2, ms3 = st.columns([2, 2, 1])
+                    with ms1:
+                        st.date_input("Date", key=f"md_{m_idx}", label_visibility="collapsed")
+                    with ms2:
+                        st.time_input("Time", key=f"mt_{m_idx}",
+                                      step=timedelta(minutes=30),
+                                      label_visibility="collapsed")
+                    with ms3:
+                        st.button(
+                            "✅ Confirm", key=f"mconf_{m_idx}", type="primary",
+                            on_click=_confirm_reply_schedule,
+                            args=(("manual", m_idx), f"manual_reply_{m_idx}", tweet.get("id"),
+                                  f"md_{m_idx}", f"mt_{m_idx}", "reply_account_manual"),
+                        )
+                    sched_err = schedule_errors.pop(("manual", m_idx), None)
+                    if sched_err:
+                        st.error(f"Schedule error: {sched_err}")
 
                 st.markdown("---")
 
@@ -6,7 +6,6 @@ Supports platform-specific prompts and dynamic topic adaptation.
 
 import os
 import json
-import re
 from pathlib import Path
 from dotenv import load_dotenv
 from google import genai
@@ -71,6 +70,22 @@ RULES:
 Return ONLY valid JSON, no markdown fences, no extra text."""
 
 
+def _caption_config(system_prompt: str) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=0.8,
+        max_output_tokens=1024,
+        system_instruction=system_prompt,
+        response_mime_type="application/json",
+    )
+
+
+# Built once at import; generate_content only reads the config, so calls share it
+_CONFIGS = {
+    "instagram": _caption_config(INSTAGRAM_SYSTEM_PROMPT),
+    "twitter": _caption_config(TWITTER_SYSTEM_PROMPT),
+}
+
+
 def generate_caption(joke_text: str, topic: str = "", platform: str = "instagram") -> dict:
     """
     Generate viral-ready caption metadata from a joke/punchline.
@@ -87,8 +102,6 @@ def generate_caption(joke_text: str, topic: str = "", platform: str = "instagram
     platform = platform.lower().strip()
     is_twitter = platform in ("twitter", "x")
 
-    system_prompt = TWITTER_SYSTEM_PROMPT if is_twitter else INSTAGRAM_SYSTEM_PROMPT
-
     user_prompt = f"""TOPIC: {topic if topic else "General humor"}
 
 CONTENT/JOKE:
@@ -96,53 +109,68 @@ CONTENT/JOKE:
 
 Generate the {"tweet" if is_twitter else "viral caption"} JSON now."""
 
-    config = types.GenerateContentConfig(
-        temperature=0.8,
-        max_output_tokens=1024,
-        system_instruction=system_prompt,
-        response_mime_type="application/json",
-    )
-
     response = _get_client().models.generate_content(
         model=MODEL,
         contents=user_prompt,
-        config=config,
+        config=_CONFIGS["twitter" if is_twitter else "instagram"],
     )
 
-    result_text = response.text
+    result_text = response.text or ""
 
     # Parse JSON response
     try:
         data = json.loads(result_text)
     except json.JSONDecodeError:
-        # Try to extract JSON from response
-        json_match = re.search(r'\{[\s\S]*\}', result_text)
-        if json_match:
-            try:
-                data = json.loads(json_match.group())
-            except json.JSONDecodeError:
-                data = _fallback_response(joke_text, is_twitter)
-        else:
+        # Try to extract JSON from response (fenced or wrapped in prose)
+        data = _extract_json(result_text)
+        if data is None:
             data = _fallback_response(joke_text, is_twitter)
 
     return data
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str):
+    """
+    Return the first JSON object embedded in text, or None.
+    Tries raw_decode (C scanner, string/brace-aware) at each '{' so a fenced block
+    or trailing prose doesn't break parsing the way a greedy regex span does.
+    """
+    idx = text.find("{")
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        idx = text.find("{", idx + 1)
+    return None
+
+
+# Fallback caption templates; only the joke-derived field is filled per call
+_FALLBACK_TWITTER = {
+    "tweet_text": "",
+    "alt_tweet": "",
+    "thread_hook": "",
+    "hashtags": "#funny #trending",
+}
+_FALLBACK_INSTAGRAM = {
+    "caption_hook": "🔥 You won't believe this!",
+    "caption_body": "",
+    "call_to_action": "Tag a friend who needs to see this 👇",
+    "hashtags": "#funny #memes #relatable #viral #trending",
+}
+
+
 def _fallback_response(joke_text: str, is_twitter: bool) -> dict:
     """Return a safe fallback if Gemini fails to produce valid JSON."""
     if is_twitter:
-        return {
-            "tweet_text": joke_text[:270] + "…" if len(joke_text) > 270 else joke_text,
-            "alt_tweet": "",
-            "thread_hook": "",
-            "hashtags": "#funny #trending",
-        }
-    return {
-        "caption_hook": "🔥 You won't believe this!",
-        "caption_body": joke_text[:100],
-        "call_to_action": "Tag a friend who needs to see this 👇",
-        "hashtags": "#funny #memes #relatable #viral #trending",
-    }
+        tweet = joke_text[:270] + "…" if len(joke_text) > 270 else joke_text
+        return {**_FALLBACK_TWITTER, "tweet_text": tweet}
+    return {**_FALLBACK_INSTAGRAM, "caption_body": joke_text[:100]}
 
 
 def format_caption(data: dict, platform: str = "instagram") -> str:
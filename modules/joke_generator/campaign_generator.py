@@ -1,14 +1,16 @@
 """
 V12 Campaign Generator
 Refactored for Unified Content Engine — uses relative imports, no sys.path hack.
-Exports: find_matching_structures, search_bridges, generate_from_selected,
+Exports: find_matching_structures, search_bridges, search_bridges_many,
+         generate_from_selected, generate_from_selected_batch,
          generate_campaign, generate_campaign_json
 """
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
 
 from .bridge_manager import expand_headline_to_themes
-from .db_manager import get_embedding, search_by_bridge
+from .db_manager import get_embedding, get_embeddings, search_by_bridge
 from .engine import generate_v11_joke
 
 
@@ -55,6 +57,64 @@ def search_bridges(headline: str, top_k: int = 30) -> List[Dict]:
     return matches
 
 
+def search_bridges_many(
+    headlines: List[str], top_k: int = 30, max_workers: int = 8
+) -> Tuple[Dict[str, List[Dict]], Dict[str, Exception]]:
+    """
+    search_bridges for a batch of headlines: theme expansion and the vector RPCs
+    run concurrently, and all embeddings come from a single API request.
+
+    Returns ({headline: matches}, {headline: error}). A headline whose theme
+    expansion, embedding or RPC failed appears only in the errors dict, so
+    callers can tell "no bridges" from "search failed".
+    """
+    print(f"🔍 SEARCHING BRIDGES FOR {len(headlines)} HEADLINES")
+
+    matches, errors = {}, {}
+
+    def _themes(headline):
+        try:
+            return expand_headline_to_themes(headline)
+        except Exception as e:
+            print(f"   ⚠️ Theme expansion failed for '{headline}': {e}")
+            errors[headline] = e
+            return None
+
+    def _embed_one(headline, query):
+        try:
+            return get_embedding(query)
+        except Exception as e:
+            errors[headline] = e
+            return None
+
+    def _search(headline, embedding):
+        if headline in errors:
+            return
+        if not embedding:
+            matches[headline] = []
+            return
+        try:
+            matches[headline] = search_by_bridge(embedding, match_count=top_k)
+        except Exception as e:
+            # One failed RPC shouldn't sink the other headlines
+            print(f"   ❌ Bridge search failed for '{headline}': {e}")
+            errors[headline] = e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        queries = list(pool.map(_themes, headlines))
+        pending = [(h, q) for h, q in zip(headlines, queries) if h not in errors]
+        try:
+            embeddings = get_embeddings([q for _, q in pending])
+        except Exception as e:
+            # Batch request failed — retry per headline so only the bad ones fail
+            print(f"   ⚠️ Batched embedding failed ({e}); retrying per headline")
+            embeddings = list(pool.map(lambda hq: _embed_one(*hq), pending))
+        list(pool.map(_search, [h for h, _ in pending], embeddings))
+
+    print(f"   Found {sum(len(m) for m in matches.values())} matches, {len(errors)} failed searches")
+    return matches, errors
+
+
 def generate_from_selected(headline: str, selected_matches: List[Dict]) -> List[Dict]:
     """
     Phase 2: Generate jokes only for user-selected bridge matches.
@@ -83,34 +143,15 @@ def generate_from_selected(headline: str, selected_matches: List[Dict]) -> List[
         print(f"📝 Joke: {reference_joke[:80]}...")
         print()
 
-        try:
-            generated = generate_v11_joke(reference_joke, headline)
-
-            if generated.get('success'):
-                provider = generated.get('_provider', 'gemini')
-                result = {
-                    "original_id": joke_id,
-                    "searchable_text": reference_joke,
-                    "bridge_content": bridge,
-                    "similarity": similarity,
-                    "engine": generated.get('engine_selected'),
-                    "selected_strategy": generated.get('selected_strategy'),
-                    "joke": generated.get('draft_joke'),
-                    "brainstorming": generated.get('brainstorming', []),
-                    "provider": provider,
-                }
-                results.append(result)
-
-                provider_badge = "🟢 Gemini" if provider == "gemini" else "🟡 OpenAI"
-                print(f"✅ Engine: {result['engine']} [{provider_badge}]")
-                print(f"💡 Strategy: {result['selected_strategy']}")
-                print(f"🎭 Joke: {result['joke']}")
-            else:
-                print(f"❌ Generation failed: {generated.get('error')}")
-
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        result = _generate_one(headline, match)
+        if result is None:
             continue
+        results.append(result)
+
+        provider_badge = "🟢 Gemini" if result['provider'] == "gemini" else "🟡 OpenAI"
+        print(f"✅ Engine: {result['engine']} [{provider_badge}]")
+        print(f"💡 Strategy: {result['selected_strategy']}")
+        print(f"🎭 Joke: {result['joke']}")
 
     # Provider summary
     gemini_count = sum(1 for r in results if r.get('provider') == 'gemini')
@@ -126,6 +167,60 @@ def generate_from_selected(headline: str, selected_matches: List[Dict]) -> List[
     return results
 
 
+def _generate_one(headline: str, match: Dict):
+    """Generate one joke for (headline, match); returns the result dict or None on failure."""
+    reference_joke = match.get('searchable_text', '')
+    try:
+        generated = generate_v11_joke(reference_joke, headline)
+    except Exception as e:
+        print(f"❌ Error ({match.get('id')}): {e}")
+        return None
+
+    if not generated.get('success'):
+        print(f"❌ Generation failed ({match.get('id')}): {generated.get('error')}")
+        return None
+
+    return {
+        "original_id": match.get('id'),
+        "searchable_text": reference_joke,
+        "bridge_content": match.get('bridge_content', ''),
+        "similarity": match.get('similarity', 0),
+        "engine": generated.get('engine_selected'),
+        "selected_strategy": generated.get('selected_strategy'),
+        "joke": generated.get('draft_joke'),
+        "brainstorming": generated.get('brainstorming', []),
+        "provider": generated.get('_provider', 'gemini'),
+    }
+
+
+def generate_from_selected_batch(
+    jobs: List[Tuple[str, List[Dict]]], max_workers: int = 8
+) -> Dict[str, List[Dict]]:
+    """
+    Phase 2 for many headlines at once: every (headline, match) pair across all
+    jobs goes into one shared worker pool, so a run costs roughly the slowest
+    few LLM calls rather than the sum of them.
+
+    Returns {headline: [jokes]} with jokes in the same order as each job's matches.
+    """
+    pairs = [(headline, match) for headline, matches in jobs for match in matches]
+    print(f"🔥 GENERATING {len(pairs)} JOKES ACROSS {len(jobs)} HEADLINES ({max_workers} workers)")
+
+    results = {headline: [] for headline, _ in jobs}
+    if not pairs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        generated = pool.map(lambda pair: _generate_one(*pair), pairs)
+        for (headline, _), result in zip(pairs, generated):
+            if result is not None:
+                results[headline].append(result)
+
+    total = sum(len(r) for r in results.values())
+    print(f"✅ Generated: {total} jokes from {len(pairs)} bridges")
+    return results
+
+
 def generate_campaign(headline: str, top_k: int = 10) -> List[Dict]:
     """
     Master loop that generates joke variations based on a headline.
@@ -47,6 +47,35 @@ def get_embedding(text: str) -> list:
     return response.data[0].embedding
 
 
+def get_embeddings(texts: list) -> list:
+    """
+    Batch version of get_embedding: one OpenAI request for all texts.
+    Returns a list aligned with texts (None for blank entries).
+    """
+    from openai import OpenAI
+
+    openai_key = os.getenv("OPENAI_API_KEY")
+    if not openai_key:
+        raise ValueError("OPENAI_API_KEY not found in environment. Check your .env file.")
+
+    cleaned = [t.replace("\n", " ").strip() for t in texts]
+    wanted = [i for i, t in enumerate(cleaned) if t]
+    embeddings = [None] * len(texts)
+    if not wanted:
+        return embeddings
+
+    client = OpenAI(api_key=openai_key)
+    response = client.embeddings.create(
+        input=[cleaned[i] for i in wanted],
+        model="text-embedding-3-small"
+    )
+
+    # The API returns one item per input, each carrying its input index
+    for item in response.data:
+        embeddings[wanted[item.index]] = item.embedding
+    return embeddings
+
+
 def get_all_jokes(limit: int = None):
     """Get all jokes from the database."""
     supabase = get_supabase_client()
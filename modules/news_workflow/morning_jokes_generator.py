@@ -13,6 +13,7 @@ or run standalone.
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure project root is on sys.path
@@ -51,30 +52,39 @@ def run_daily_pipeline():
 
     jokes_by_headline = {}
 
-    for idx, headline in enumerate(headlines):
-        print()
-        print(f"{'─' * 50}")
-        print(f"📰 [{idx+1}/{len(headlines)}] {headline}")
-        print(f"{'─' * 50}")
-
-        # Search bridges
-        try:
-            matches = search_bridges(headline, top_k=15)
-            quality_matches = [m for m in matches if m.get('similarity', 0) > 0.25][:10]
-            print(f"   🔍 Found {len(matches)} bridges → {len(quality_matches)} quality matches (similarity > 0.25)")
-        except Exception as e:
-            print(f"   ❌ Bridge search failed: {e}")
-            jokes_by_headline[headline] = []
-            continue
-
-        # Generate jokes from quality matches
-        try:
-            jokes = generate_from_selected(headline, quality_matches)
-            jokes_by_headline[headline] = jokes
-            print(f"   ✅ Generated {len(jokes)} jokes")
-        except Exception as e:
-            print(f"   ❌ Joke generation failed: {e}")
-            jokes_by_headline[headline] = []
+    # Two-stage pipeline: the bridge search for headline j+1 runs in the
+    # background while jokes are generated for headline j.
+    with ThreadPoolExecutor(max_workers=1) as search_pool:
+        next_search = search_pool.submit(search_bridges, headlines[0], top_k=15)
+
+        for idx, headline in enumerate(headlines):
+            search_future = next_search
+            if idx + 1 < len(headlines):
+                next_search = search_pool.submit(search_bridges, headlines[idx + 1], top_k=15)
+
+            print()
+            print(f"{'─' * 50}")
+            print(f"📰 [{idx+1}/{len(headlines)}] {headline}")
+            print(f"{'─' * 50}")
+
+            # Search bridges
+            try:
+                matches = search_future.result()
+                quality_matches = [m for m in matches if m.get('similarity', 0) > 0.25][:10]
+                print(f"   🔍 Found {len(matches)} bridges → {len(quality_matches)} quality matches (similarity > 0.25)")
+            except Exception as e:
+                print(f"   ❌ Bridge search failed: {e}")
+                jokes_by_headline[headline] = []
+                continue
+
+            # Generate jokes from quality matches
+            try:
+                jokes = generate_from_selected(headline, quality_matches)
+                jokes_by_headline[headline] = jokes
+                print(f"   ✅ Generated {len(jokes)} jokes")
+            except Exception as e:
+                print(f"   ❌ Joke generation failed: {e}")
+                jokes_by_headline[headline] = []
 
     total = sum(len(j) for j in jokes_by_headline.values())
     print()
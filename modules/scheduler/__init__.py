@@ -4,11 +4,13 @@ Handles slot calculation, Supabase storage, and queue management.
 """
 
 from .scheduler_db import (
+    get_client,
     upload_to_storage,
     delete_from_storage,
     insert_schedule,
     get_pending_posts,
     get_all_scheduled,
+    get_all_scheduled_grouped,
     get_last_scheduled_time,
     mark_posted,
     mark_failed,
@@ -9,6 +9,7 @@ Works wherever the Streamlit app runs:
 Uses the same credential flow as app.py — no separate secrets needed.
 """
 
+import functools
 import os
 import time
 import tempfile
@@ -29,7 +30,8 @@ if not logger.handlers:
 
 # ─── Configuration ───────────────────────────────────────────────────────────
 
-CHECK_INTERVAL = 60  # seconds between checks
+CHECK_INTERVAL = 60       # seconds between checks (default; see start_publisher)
+MAX_IDLE_INTERVAL = 300   # cap for the idle backoff when no posts are due
 
 # Instagram Graph API
 GRAPH_API_URL = "https://graph.facebook.com/v22.0"
@@ -46,13 +48,19 @@ TABLE_NAME = "content_schedule"
 
 # ─── Supabase Client ─────────────────────────────────────────────────────────
 
-def _get_supabase():
+@functools.lru_cache(maxsize=None)
+def _supabase_for(url, key):
     from supabase import create_client
+    return create_client(url, key)
+
+
+def _get_supabase():
     url = os.environ.get("SUPABASE_URL", "")
     key = os.environ.get("SUPABASE_KEY", "")
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_KEY not available")
-    return create_client(url, key)
+    # Reused across poll cycles so keep-alive connections survive between checks
+    return _supabase_for(url, key)
 
 
 # ─── Download Helper ─────────────────────────────────────────────────────────
@@ -99,16 +107,15 @@ def _publish_instagram(video_path, caption, account="khushal_page", video_url=No
         try:
             supabase = _get_supabase()
             temp_name = f"temp_ig_upload_{os.path.basename(video_path)}"
-            with open(video_path, "rb") as f:
-                video_bytes = f.read()
             try:
                 supabase.storage.from_("ready_to_publish").remove([temp_name])
             except Exception:
                 pass
-            supabase.storage.from_("ready_to_publish").upload(
-                path=temp_name, file=video_bytes,
-                file_options={"content-type": "video/mp4"},
-            )
+            with open(video_path, "rb") as f:
+                supabase.storage.from_("ready_to_publish").upload(
+                    path=temp_name, file=f,
+                    file_options={"content-type": "video/mp4"},
+                )
             sb_url = os.environ.get("SUPABASE_URL", "")
             video_url = f"{sb_url}/storage/v1/object/public/ready_to_publish/{temp_name}"
             logger.info(f"\u2601\ufe0f Uploaded to temp storage: {temp_name}")
@@ -492,31 +499,39 @@ def publish_due_posts():
 
 _publisher_thread = None
 _publisher_running = False
+_stop_event = threading.Event()
 
 
-def _publisher_loop():
-    """Background loop that checks for due posts every CHECK_INTERVAL seconds."""
+def _publisher_loop(interval):
+    """
+    Background loop that checks for due posts every `interval` seconds.
+    While nothing is due the wait doubles (up to MAX_IDLE_INTERVAL) and
+    drops back to `interval` as soon as a run finds work.
+    """
     global _publisher_running
-    logger.info(f"🚀 Auto-publisher started (checking every {CHECK_INTERVAL}s)")
+    logger.info(f"🚀 Auto-publisher started (checking every {interval}s)")
 
+    wait = interval
     while _publisher_running:
         try:
             published, failed = publish_due_posts()
             if published or failed:
                 logger.info(f"Run complete: {published} published, {failed} failed")
+                wait = interval
+            else:
+                wait = min(wait * 2, max(interval, MAX_IDLE_INTERVAL))
         except Exception as e:
             logger.error(f"Publisher error: {e}")
+            wait = interval
 
-        # Sleep in small increments so we can stop quickly
-        for _ in range(CHECK_INTERVAL):
-            if not _publisher_running:
-                break
-            time.sleep(1)
+        # Event.wait returns early when stop_publisher() is called
+        if _stop_event.wait(wait):
+            break
 
     logger.info("Auto-publisher stopped")
 
 
-def start_publisher():
+def start_publisher(interval=CHECK_INTERVAL):
     """Start the background auto-publisher thread (idempotent)."""
     global _publisher_thread, _publisher_running
 
@@ -524,7 +539,8 @@ def start_publisher():
         return  # Already running
 
     _publisher_running = True
-    _publisher_thread = threading.Thread(target=_publisher_loop, daemon=True)
+    _stop_event.clear()
+    _publisher_thread = threading.Thread(target=_publisher_loop, args=(interval,), daemon=True)
     _publisher_thread.start()
 
 
@@ -532,3 +548,4 @@ def stop_publisher():
     """Stop the background auto-publisher thread."""
     global _publisher_running
     _publisher_running = False
+    _stop_event.set()
@@ -3,25 +3,69 @@ Scheduler DB — Supabase CRUD for content_schedule table & Storage.
 Handles queuing, status updates, and file storage for scheduled posts.
 """
 
+import functools
 import os
+import time
 import uuid
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 from supabase import create_client
 
+try:
+    import httpx  # supabase-py's transport
+    _UPLOAD_RETRY_ERRORS = (ConnectionError, TimeoutError, httpx.TransportError)
+    # Only errors where the request never reached the server — safe to resend an INSERT
+    _INSERT_RETRY_ERRORS = (ConnectionError, httpx.ConnectError, httpx.ConnectTimeout)
+except ImportError:
+    _UPLOAD_RETRY_ERRORS = (ConnectionError, TimeoutError)
+    _INSERT_RETRY_ERRORS = (ConnectionError,)
+
 
 # ─── Supabase Client ─────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
+def _client_for(url, key):
+    """One client (and its pooled HTTP connections) per credential pair, per process."""
+    return create_client(url, key)
+
+
 def _get_client():
     """Get Supabase client from environment variables."""
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_KEY")
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
-    return create_client(url, key)
+    return _client_for(url, key)
+
+
+def get_client():
+    """Public accessor for the scheduler's memoised Supabase client (e.g. direct Storage calls)."""
+    return _get_client()
 
 
 BUCKET_NAME = "ready_to_publish"
 TABLE_NAME = "content_schedule"
+RETRY_ATTEMPTS = 3       # upload/insert attempts on transient network errors
+IST = ZoneInfo("Asia/Kolkata")
+
+# Columns the dashboard's schedule views actually render
+SCHEDULE_LIST_COLUMNS = (
+    "id,platform,caption,scheduled_time,posted_at,status,"
+    "twitter_account,instagram_account,error_message,reply_to_tweet_id"
+)
+
+
+def _with_retry(fn, retry_on, what):
+    """Call fn(), retrying transient errors with 1s, 2s backoff (3 attempts total)."""
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return fn()
+        except retry_on as e:
+            if attempt == RETRY_ATTEMPTS - 1:
+                raise
+            delay = 2 ** attempt
+            print(f"   ⚠️  {what} failed ({e}) — retrying in {delay}s")
+            time.sleep(delay)
 
 
 # ─── Storage Operations ─────────────────────────────────────────────────────
@@ -39,12 +83,17 @@ def upload_to_storage(file_path):
     client = _get_client()
     file_name = f"{uuid.uuid4().hex}_{os.path.basename(file_path)}"
 
-    with open(file_path, "rb") as f:
-        client.storage.from_(BUCKET_NAME).upload(
-            path=file_name,
-            file=f,
-            file_options={"content-type": "video/mp4"},
-        )
+    def _upload():
+        with open(file_path, "rb") as f:
+            client.storage.from_(BUCKET_NAME).upload(
+                path=file_name,
+                file=f,
+                # file_name is unique per call, so upsert only matters on a retry whose
+                # first attempt stored the object before timing out (else a 409 Duplicate)
+                file_options={"content-type": "video/mp4", "upsert": "true"},
+            )
+
+    _with_retry(_upload, _UPLOAD_RETRY_ERRORS, "Storage upload")
 
     public_url = client.storage.from_(BUCKET_NAME).get_public_url(file_name)
     print(f"   ☁️  Uploaded to Storage: {file_name}")
@@ -108,14 +157,17 @@ def insert_schedule(platform, video_url, caption, scheduled_time, twitter_accoun
     if reply_to_tweet_id:
         data["reply_to_tweet_id"] = reply_to_tweet_id
 
+    def _insert():
+        return client.table(TABLE_NAME).insert(data).execute()
+
     try:
-        result = client.table(TABLE_NAME).insert(data).execute()
+        result = _with_retry(_insert, _INSERT_RETRY_ERRORS, "Schedule insert")
     except Exception as e:
         # If the column doesn't exist yet, retry without it
         if "reply_to_tweet_id" in str(e) and reply_to_tweet_id:
             print(f"   ⚠️ reply_to_tweet_id column missing — scheduling without reply chain")
             data.pop("reply_to_tweet_id", None)
-            result = client.table(TABLE_NAME).insert(data).execute()
+            result = _with_retry(_insert, _INSERT_RETRY_ERRORS, "Schedule insert")
         else:
             raise
 
@@ -145,19 +197,20 @@ def get_pending_posts():
     return result.data or []
 
 
-def get_all_scheduled(status=None):
+def get_all_scheduled(status=None, columns="*"):
     """
     List all scheduled posts, optionally filtered by status.
 
     Args:
         status: "pending", "posted", "failed", or None for all.
+        columns: PostgREST select list, e.g. SCHEDULE_LIST_COLUMNS.
 
     Returns:
         list[dict]: List of scheduled posts.
     """
     client = _get_client()
 
-    query = client.table(TABLE_NAME).select("*")
+    query = client.table(TABLE_NAME).select(columns)
     if status:
         query = query.eq("status", status)
 
@@ -165,6 +218,48 @@ def get_all_scheduled(status=None):
     return result.data or []
 
 
+def get_all_scheduled_grouped(columns="*"):
+    """
+    Fetch pending, posted and failed posts in a single query and
+    partition them by status client-side.
+
+    Rows come back ordered by scheduled_time ascending, so each
+    bucket is already in queue order.
+
+    Args:
+        columns: PostgREST select list, e.g. SCHEDULE_LIST_COLUMNS.
+                 Must include "status".
+
+    Returns:
+        dict[str, list[dict]]: {"pending": [...], "posted": [...], "failed": [...]}
+    """
+    client = _get_client()
+
+    def _query(cols):
+        return (
+            client.table(TABLE_NAME)
+            .select(cols)
+            .in_("status", ["pending", "posted", "failed"])
+            .order("scheduled_time", desc=False)
+            .execute()
+        )
+
+    try:
+        result = _query(columns)
+    except Exception as e:
+        # If the column doesn't exist yet, retry without it
+        if "reply_to_tweet_id" in str(e) and "reply_to_tweet_id" in columns:
+            cols = ",".join(c for c in columns.split(",") if c.strip() != "reply_to_tweet_id")
+            result = _query(cols)
+        else:
+            raise
+
+    grouped = {"pending": [], "posted": [], "failed": []}
+    for row in result.data or []:
+        grouped[row["status"]].append(row)
+    return grouped
+
+
 def get_last_scheduled_time(platform=None, twitter_account=None):
     """
     Get the scheduled_time of the most recent pending post,
@@ -292,16 +387,16 @@ def format_time_ist(iso_string):
         return "N/A"
 
     try:
-        from dateutil.parser import parse as parse_dt
-        import pytz
-
-        dt = parse_dt(iso_string)
-        ist = pytz.timezone("Asia/Kolkata")
+        try:
+            dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
+        except ValueError:
+            from dateutil.parser import parse as parse_dt
+            dt = parse_dt(iso_string)
 
         if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
+            dt = dt.replace(tzinfo=timezone.utc)
 
-        dt_ist = dt.astimezone(ist)
+        dt_ist = dt.astimezone(IST)
         return dt_ist.strftime("%a, %b %d at %I:%M %p IST")
     except Exception:
         return str(iso_string)[:16]
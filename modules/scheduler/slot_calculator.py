@@ -4,11 +4,11 @@ Auto-fills posting times at 09:00, 14:00, 19:00 IST.
 """
 
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 
 # ─── Configuration ────────────────────────────────────────────────────────────
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 # 3 daily posting slots (hour, minute) in IST
 SLOT_TIMES = [
@@ -57,7 +57,7 @@ def get_next_slot(last_scheduled_time=None):
         # ── Queue exists: find the next slot after last_scheduled_time ──
         # Make sure it's IST-aware
         if last_scheduled_time.tzinfo is None:
-            last_scheduled_time = IST.localize(last_scheduled_time)
+            last_scheduled_time = last_scheduled_time.replace(tzinfo=IST)
         else:
             last_scheduled_time = last_scheduled_time.astimezone(IST)
 
@@ -68,10 +68,8 @@ def get_next_slot(last_scheduled_time=None):
         # Find the next slot on the same day
         for hour, minute in SLOT_TIMES:
             if (hour, minute) > (last_hour, last_minute):
-                candidate = IST.localize(
-                    datetime.combine(last_date, datetime.min.time()).replace(
-                        hour=hour, minute=minute, second=0, microsecond=0
-                    )
+                candidate = datetime.combine(
+                    last_date, datetime.min.time().replace(hour=hour, minute=minute), tzinfo=IST
                 )
                 if candidate > now:
                     return candidate
@@ -79,10 +77,8 @@ def get_next_slot(last_scheduled_time=None):
         # All slots on that day are used → first slot next day
         next_day = last_date + timedelta(days=1)
         first_hour, first_minute = SLOT_TIMES[0]
-        candidate = IST.localize(
-            datetime.combine(next_day, datetime.min.time()).replace(
-                hour=first_hour, minute=first_minute, second=0, microsecond=0
-            )
+        candidate = datetime.combine(
+            next_day, datetime.min.time().replace(hour=first_hour, minute=first_minute), tzinfo=IST
         )
 
         # Safety: if even next_day's first slot is in the past (queue is very old),
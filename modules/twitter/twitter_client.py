@@ -14,6 +14,7 @@ Usage:
 import json
 import math
 import os
+import queue
 import time
 
 import requests
@@ -93,6 +94,11 @@ class TwitterClient:
 
         self._load_creds()
 
+        # Pooled keep-alive connections. Clients are cached per account and shared
+        # across Streamlit sessions, so each in-flight call borrows its own Session
+        # rather than queueing behind another session's (possibly 60s) upload chunk
+        self._sessions = queue.LifoQueue()
+
     # ── Credentials ───────────────────────────────────────────────────────
 
     def _load_creds(self):
@@ -140,7 +146,8 @@ class TwitterClient:
                 f"Re-run: python twitter_auth.py --name {self.account_name}"
             )
 
-        resp = requests.post(
+        resp = self._send(
+            "POST",
             TOKEN_URL,
             data={
                 "grant_type": "refresh_token",
@@ -181,6 +188,17 @@ class TwitterClient:
             resource_owner_secret=self.access_token_secret,
         )
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Issue a raw request over an idle pooled Session (a new one if all are busy)."""
+        try:
+            http = self._sessions.get_nowait()
+        except queue.Empty:
+            http = requests.Session()
+        try:
+            return http.request(method, url, **kwargs)
+        finally:
+            self._sessions.put(http)
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Make an authenticated API request."""
         if self.auth_type == "oauth1":
@@ -190,7 +208,7 @@ class TwitterClient:
             kwargs["headers"]["Authorization"] = f"Bearer {self.access_token}"
 
         kwargs.setdefault("timeout", 30)
-        return requests.request(method, url, **kwargs)
+        return self._send(method, url, **kwargs)
 
     # ── API Methods ───────────────────────────────────────────────────────
 
@@ -287,7 +305,7 @@ class TwitterClient:
             "media_type": media_type,
             "media_category": media_category,
         }
-        resp = requests.post(MEDIA_UPLOAD_URL, data=init_data, auth=auth, timeout=30)
+        resp = self._send("POST", MEDIA_UPLOAD_URL, data=init_data, auth=auth, timeout=30)
         if resp.status_code not in (200, 201, 202):
             raise TwitterClientError(
                 f"Media upload INIT failed (HTTP {resp.status_code}): {resp.text}"
@@ -305,8 +323,8 @@ class TwitterClient:
                     "segment_index": segment_index,
                 }
                 files = {"media": (file_name, chunk, media_type)}
-                resp = requests.post(
-                    MEDIA_UPLOAD_URL, data=append_data, files=files,
+                resp = self._send(
+                    "POST", MEDIA_UPLOAD_URL, data=append_data, files=files,
                     auth=auth, timeout=60
                 )
                 if resp.status_code not in (200, 204):
@@ -320,7 +338,7 @@ class TwitterClient:
             "command": "FINALIZE",
             "media_id": media_id,
         }
-        resp = requests.post(MEDIA_UPLOAD_URL, data=finalize_data, auth=auth, timeout=30)
+        resp = self._send("POST", MEDIA_UPLOAD_URL, data=finalize_data, auth=auth, timeout=30)
         if resp.status_code not in (200, 201):
             raise TwitterClientError(
                 f"Media upload FINALIZE failed (HTTP {resp.status_code}): {resp.text}"
@@ -340,7 +358,8 @@ class TwitterClient:
         waited = 0
 
         while waited < max_wait:
-            resp = requests.get(
+            resp = self._send(
+                "GET",
                 MEDIA_UPLOAD_URL,
                 params={"command": "STATUS", "media_id": media_id},
                 auth=auth,
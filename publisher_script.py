@@ -142,16 +142,15 @@ def publish_to_instagram(video_path, caption, account="khushal_page", video_url=
         try:
             supabase = get_supabase()
             temp_name = f"temp_ig_upload_{os.path.basename(video_path)}"
-            with open(video_path, "rb") as f:
-                video_bytes = f.read()
             try:
                 supabase.storage.from_(BUCKET_NAME).remove([temp_name])
             except Exception:
                 pass
-            supabase.storage.from_(BUCKET_NAME).upload(
-                path=temp_name, file=video_bytes,
-                file_options={"content-type": "video/mp4"},
-            )
+            with open(video_path, "rb") as f:
+                supabase.storage.from_(BUCKET_NAME).upload(
+                    path=temp_name, file=f,
+                    file_options={"content-type": "video/mp4"},
+                )
             video_url = f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET_NAME}/{temp_name}"
             print(f"   ☁️ Uploaded to temp storage: {temp_name}")
         except Exception as e: